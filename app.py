@@ -1,15 +1,36 @@
+import os
 import re
+import gzip
+import hashlib
+import time
 import atexit
 import logging
-from flask import Flask, jsonify, request, render_template
-from hyperliquid import fetch_and_parse_trades, fetch_funding_events, fetch_open_positions
+import threading
+import orjson
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator
+from flask import Flask, Response, g, request, render_template
+from hyperliquid import fetch_and_parse_trades, fetch_funding_events, fetch_open_positions, prefetch_spot_meta
 from constants import ErrorMsg, ROUND_TRIP_PREFIX
 from scheduler import (
     start_scheduler,
     stop_scheduler,
     register_wallet_for_sync,
     unregister_wallet,
-    is_wallet_registered
+    is_wallet_registered,
+    submit_sync_job,
+    get_sync_job
+)
+from sentiment import (
+    NewsAggregator,
+    SentimentAnalyzer,
+    SignalRepository,
+    init_sentiment_db,
+    get_sentiment_session,
+    get_sentiment_bot,
+    create_sentiment_bot,
+    destroy_sentiment_bot
 )
 from config import (
     DATABASE_URL,
@@ -19,7 +40,8 @@ from config import (
     SENTIMENT_POLL_INTERVAL,
     SENTIMENT_BOT_NAME,
     TWITTER_ENABLED,
-    TWITTER_ACCOUNTS
+    TWITTER_ACCOUNTS,
+    SENTIMENT_PREFILTER
 )
 
 # Configure logging
@@ -36,28 +58,32 @@ from storage import (
     get_trades_sorted,
     get_round_trips,
     update_round_trip_notes,
-    get_unique_assets
+    get_unique_assets,
+    get_init_bundle,
+    WALLET_CACHE_TTL,
+    WALLET_CACHE_MAXSIZE
 )
 
 app = Flask(__name__)
 
-# Start background scheduler only in main process (not in gunicorn workers)
-import os
+# Start background jobs in one process only: the reloader child in debug, and
+# whichever gunicorn worker takes the scheduler file lock in production
+_scheduler_started = False
 if os.environ.get("WERKZEUG_RUN_MAIN") == "true" or not app.debug:
-    # Only start if we're the main process or in production
-    # Use a file lock to prevent multiple schedulers in gunicorn
-    _scheduler_started = False
     try:
-        start_scheduler()
-        _scheduler_started = True
-        atexit.register(stop_scheduler)
+        _scheduler_started = start_scheduler()
+        if _scheduler_started:
+            atexit.register(stop_scheduler)
+            # Warm Hyperliquid spot metadata in the one startup process only;
+            # other workers and plain imports load it lazily on first use
+            prefetch_spot_meta()
     except Exception as e:
-        logger.warning("Scheduler already running or failed to start: %s", e)
+        logger.warning("Failed to start scheduler: %s", e)
 
+if _scheduler_started:
     # Auto-start sentiment bot if configured
     if all([DATABASE_URL, ANTHROPIC_API_KEY, DISCORD_WEBHOOK_URL]):
         try:
-            from sentiment import create_sentiment_bot, destroy_sentiment_bot
             logger.info("Auto-starting sentiment bot...")
             bot = create_sentiment_bot(
                 database_url=DATABASE_URL,
@@ -66,7 +92,8 @@ if os.environ.get("WERKZEUG_RUN_MAIN") == "true" or not app.debug:
                 cryptopanic_api_key=CRYPTOPANIC_API_KEY,
                 poll_interval=SENTIMENT_POLL_INTERVAL,
                 twitter_enabled=TWITTER_ENABLED,
-                twitter_accounts=TWITTER_ACCOUNTS
+                twitter_accounts=TWITTER_ACCOUNTS,
+                prefilter=SENTIMENT_PREFILTER
             )
             bot.start(send_startup_message=False)  # Don't spam Discord on every deploy
             atexit.register(destroy_sentiment_bot)
@@ -77,33 +104,222 @@ if os.environ.get("WERKZEUG_RUN_MAIN") == "true" or not app.debug:
         logger.info("Sentiment bot not configured, skipping auto-start")
 
 # Ethereum address pattern: 0x followed by 40 hex characters
-WALLET_PATTERN = re.compile(r'^0x[a-fA-F0-9]{40}$')
+# Bound fullmatch needs no anchors and skips the attribute lookup per call
+_wallet_fullmatch = re.compile(r'0x[a-fA-F0-9]{40}').fullmatch
 
 
 def is_valid_wallet(wallet: str) -> bool:
     """Validate Ethereum wallet address format."""
-    return bool(wallet and WALLET_PATTERN.match(wallet))
+    return isinstance(wallet, str) and _wallet_fullmatch(wallet) is not None
+
 
+def get_wallet_from_request(data: dict | None = None) -> str | None:
+    """
+    Get and validate wallet address from request (query param, body, or header).
 
-def get_wallet_from_request() -> str | None:
-    """Get and validate wallet address from request (query param, body, or header)."""
-    # Try query param first
-    wallet = request.args.get("wallet")
+    The validated result is cached on flask.g, so repeated calls within one
+    request are a single lookup.
+
+    Args:
+        data: Already-parsed JSON body, if the caller has one (avoids re-reading
+            it). Its wallet_address is checked before the query param.
+    """
+    if "wallet" in g:
+        return g.wallet
+
+    # A body passed in by the caller wins, then the query param
+    wallet = data.get("wallet_address") if data else None
+    if not wallet:
+        wallet = request.args.get("wallet")
     # Then try JSON body
-    if not wallet and request.is_json:
-        data = request.get_json(silent=True) or {}
-        wallet = data.get("wallet_address") or data.get("wallet")
+    if not wallet:
+        if data is None and request.is_json:
+            data = request.get_json(silent=True, cache=True)
+        if data:
+            wallet = data.get("wallet_address") or data.get("wallet")
     # Then try header
     if not wallet:
         wallet = request.headers.get("X-Wallet-Address")
 
     # Validate format
     if wallet and not is_valid_wallet(wallet):
-        return None
+        wallet = None
 
+    g.wallet = wallet
     return wallet
 
 
+def _json_response(obj, status: int = 200) -> Response:
+    """Serialize a response body with orjson (faster than jsonify for large lists)."""
+    return Response(orjson.dumps(obj), status=status, mimetype="application/json")
+
+
+# Pre-encoded bodies for the fixed validation errors
+_ERROR_BODIES: dict[str, bytes] = {
+    message: orjson.dumps({"error": message})
+    for message in (
+        ErrorMsg.WALLET_REQUIRED,
+        ErrorMsg.WALLET_NOT_PROVIDED,
+        ErrorMsg.WALLET_INVALID,
+        ErrorMsg.NOTES_REQUIRED,
+        ErrorMsg.TRADE_NOT_FOUND,
+        ErrorMsg.SYNC_JOB_NOT_FOUND,
+    )
+}
+
+
+def _error_response(message: str, status: int = 400) -> Response:
+    """Build an error response, reusing the pre-encoded body for ErrorMsg values."""
+    body = _ERROR_BODIES.get(message) or orjson.dumps({"error": message})
+    return Response(body, status=status, mimetype="application/json")
+
+
+# Gzip JSON bodies at least this large when the client accepts it
+COMPRESS_MIN_SIZE = 1024
+COMPRESS_LEVEL = 5
+
+
+def _wants_gzip(body: bytes) -> bool:
+    """Whether body is worth gzipping for the current request's client."""
+    return len(body) >= COMPRESS_MIN_SIZE and "gzip" in request.accept_encodings
+
+
+def _gzip_json_response(gzipped: bytes) -> Response:
+    """Build a JSON response from an already gzipped body."""
+    response = Response(gzipped, mimetype="application/json")
+    response.headers["Content-Encoding"] = "gzip"
+    response.vary.add("Accept-Encoding")
+    return response
+
+
+# Encoded bodies for cached storage results, as an LRU with the storage
+# cache's TTL: {(endpoint, wallet): (cached_at, sources, body, gzipped)}
+# gzipped is filled in the first time a gzip-capable client asks, so cache
+# hits don't pay for compression again.
+# The source objects are held alongside so a hit is only valid while storage
+# keeps returning the very same cached lists. Up to three endpoints per wallet.
+ENCODED_BODIES_MAXSIZE = 3 * WALLET_CACHE_MAXSIZE
+_encoded_bodies: OrderedDict[tuple[str, str], tuple[float, tuple, bytes, bytes | None]] = OrderedDict()
+_encoded_bodies_lock = threading.Lock()
+
+
+def _encoded_body_get(cache_key: tuple[str, str], sources: tuple) -> tuple[bytes, bytes | None] | None:
+    """
+    Return the cached (body, gzipped body) for cache_key.
+
+    None if missing, expired, or built from different storage sources.
+    """
+    with _encoded_bodies_lock:
+        entry = _encoded_bodies.get(cache_key)
+        if entry is None:
+            return None
+        cached_at, cached_sources, body, gzipped = entry
+        if time.time() - cached_at >= WALLET_CACHE_TTL or not all(
+            a is b for a, b in zip(cached_sources, sources)
+        ):
+            # Stale: don't keep the superseded storage lists alive
+            del _encoded_bodies[cache_key]
+            return None
+        _encoded_bodies.move_to_end(cache_key)
+        return body, gzipped
+
+
+def _encoded_body_set(
+    cache_key: tuple[str, str], sources: tuple, body: bytes, gzipped: bytes | None = None
+) -> None:
+    """Cache an encoded body, evicting the least recently used entry if full."""
+    with _encoded_bodies_lock:
+        _encoded_bodies[cache_key] = (time.time(), sources, body, gzipped)
+        _encoded_bodies.move_to_end(cache_key)
+        while len(_encoded_bodies) > ENCODED_BODIES_MAXSIZE:
+            _encoded_bodies.popitem(last=False)
+
+
+def _encoded_body_add_gzip(cache_key: tuple[str, str], body: bytes, gzipped: bytes) -> None:
+    """Attach the gzipped form to a cached body, keeping its original cache time."""
+    with _encoded_bodies_lock:
+        entry = _encoded_bodies.get(cache_key)
+        if entry is not None and entry[2] is body:
+            _encoded_bodies[cache_key] = (*entry[:3], gzipped)
+
+
+def _encoded_body_drop(cache_key: tuple[str, str]) -> None:
+    """Forget the cached body for cache_key."""
+    with _encoded_bodies_lock:
+        _encoded_bodies.pop(cache_key, None)
+
+
+def _cached_json_response(cache_key: tuple[str, str], obj, *sources) -> Response:
+    """Serialize obj, reusing the previous body (and its gzip) if its storage sources are unchanged."""
+    cached = _encoded_body_get(cache_key, sources)
+    if cached is None:
+        body, gzipped = orjson.dumps(obj), None
+        _encoded_body_set(cache_key, sources, body)
+    else:
+        body, gzipped = cached
+
+    if not _wants_gzip(body):
+        return Response(body, mimetype="application/json")
+    if gzipped is None:
+        gzipped = gzip.compress(body, compresslevel=COMPRESS_LEVEL)
+        _encoded_body_add_gzip(cache_key, body, gzipped)
+    return _gzip_json_response(gzipped)
+
+
+# Lists at least this long are streamed in chunks instead of encoded in one piece
+STREAM_MIN_ROWS = 5000
+STREAM_CHUNK_ROWS = 500
+
+
+def _iter_json_array(rows: list) -> Iterator[bytes]:
+    """Yield a JSON array chunk by chunk so the full body is never held in memory."""
+    yield b"["
+    for i in range(0, len(rows), STREAM_CHUNK_ROWS):
+        if i:
+            yield b","
+        # Strip the brackets from each chunk's array encoding
+        yield orjson.dumps(rows[i:i + STREAM_CHUNK_ROWS])[1:-1]
+    yield b"]"
+
+
+def _json_list_response(rows: list, cache_key: tuple[str, str] | None = None) -> Response:
+    """Return a JSON list, streaming large ones and caching the body of small ones."""
+    if len(rows) >= STREAM_MIN_ROWS:
+        if cache_key:
+            _encoded_body_drop(cache_key)
+        return Response(_iter_json_array(rows), mimetype="application/json")
+    if cache_key:
+        return _cached_json_response(cache_key, rows, rows)
+    return _json_response(rows)
+
+
+@app.after_request
+def _compress_response(response: Response) -> Response:
+    """
+    Gzip buffered JSON responses for clients that accept it.
+
+    Cached storage bodies arrive already compressed (Content-Encoding set)
+    and pass through untouched.
+    """
+    if (
+        response.status_code != 200
+        or response.is_streamed
+        or response.direct_passthrough
+        or response.mimetype != "application/json"
+        or "Content-Encoding" in response.headers
+    ):
+        return response
+
+    body = response.get_data()
+    if not _wants_gzip(body):
+        return response
+
+    response.set_data(gzip.compress(body, compresslevel=COMPRESS_LEVEL))
+    response.headers["Content-Encoding"] = "gzip"
+    response.vary.add("Accept-Encoding")
+    return response
+
+
 @app.route("/")
 def index():
     """Serve the main journal page."""
@@ -113,7 +329,7 @@ def index():
 @app.route("/health")
 def health_check():
     """Health check endpoint for Railway."""
-    return jsonify({"status": "healthy"}), 200
+    return _json_response({"status": "healthy"})
 
 
 @app.route("/api/trades", methods=["GET"])
@@ -121,37 +337,62 @@ def get_trades():
     """Get all stored trades for a wallet sorted by timestamp (newest first)."""
     wallet = get_wallet_from_request()
     if not wallet:
-        return jsonify({"error": ErrorMsg.WALLET_REQUIRED}), 400
+        return _error_response(ErrorMsg.WALLET_REQUIRED)
 
     trades = get_trades_sorted(wallet, descending=True)
-    return jsonify(trades)
+    return _json_list_response(trades, ("trades", wallet.lower()))
+
+
+def _sync_wallet(wallet_address: str) -> dict:
+    """Fetch trades from Hyperliquid and merge them into storage."""
+    new_trades = fetch_and_parse_trades(wallet_address)
+    existing = load_trades(wallet_address)
+    merged = merge_trades(existing, new_trades)
+    save_trades(merged, wallet_address)
+
+    return {
+        "message": f"Synced {len(new_trades)} trades",
+        "total_trades": len(merged)
+    }
 
 
 @app.route("/api/trades/sync", methods=["POST"])
 def sync_trades():
-    """Sync trades from Hyperliquid API for a specific wallet."""
+    """
+    Sync trades from Hyperliquid API for a specific wallet.
+
+    Runs on the scheduler's thread pool and returns 202 with a job ID to poll
+    at /api/trades/sync/status. Pass ?wait=1 to sync within the request.
+    """
     data = request.get_json() or {}
     wallet = data.get("wallet_address")
 
     if not wallet:
-        return jsonify({"error": ErrorMsg.WALLET_NOT_PROVIDED}), 400
+        return _error_response(ErrorMsg.WALLET_NOT_PROVIDED)
 
     if not is_valid_wallet(wallet):
-        return jsonify({"error": ErrorMsg.WALLET_INVALID}), 400
+        return _error_response(ErrorMsg.WALLET_INVALID)
+
+    wait = request.args.get("wait", "false").lower() in ("1", "true")
+    if not wait:
+        job_id = submit_sync_job(wallet, _sync_wallet)
+        if job_id:
+            return _json_response({"message": "Sync started", "job_id": job_id}, 202)
 
     try:
-        new_trades = fetch_and_parse_trades(wallet)
-        existing = load_trades(wallet)
-        merged = merge_trades(existing, new_trades)
-        save_trades(merged, wallet)
-
-        return jsonify({
-            "message": f"Synced {len(new_trades)} trades",
-            "total_trades": len(merged)
-        })
+        return _json_response(_sync_wallet(wallet))
     except Exception as e:
         logger.exception("Failed to sync trades for wallet %s", wallet)
-        return jsonify({"error": str(e)}), 500
+        return _error_response(str(e), 500)
+
+
+@app.route("/api/trades/sync/status", methods=["GET"])
+def get_trade_sync_status():
+    """Get the state of a sync started by POST /api/trades/sync."""
+    job = get_sync_job(request.args.get("job", ""))
+    if job is None:
+        return _error_response(ErrorMsg.SYNC_JOB_NOT_FOUND, 404)
+    return _json_response(job)
 
 
 @app.route("/api/trades/<trade_id>/notes", methods=["PUT"])
@@ -159,11 +400,11 @@ def update_notes(trade_id: str):
     """Update notes for a specific trade or round trip."""
     data = request.get_json()
     if not data or "notes" not in data:
-        return jsonify({"error": ErrorMsg.NOTES_REQUIRED}), 400
+        return _error_response(ErrorMsg.NOTES_REQUIRED)
 
-    wallet = data.get("wallet_address") or get_wallet_from_request()
+    wallet = get_wallet_from_request(data)
     if not wallet:
-        return jsonify({"error": ErrorMsg.WALLET_REQUIRED}), 400
+        return _error_response(ErrorMsg.WALLET_REQUIRED)
 
     # Handle round trip notes (stored on exit fill)
     if trade_id.startswith(ROUND_TRIP_PREFIX):
@@ -172,9 +413,9 @@ def update_notes(trade_id: str):
         success = update_trade_notes(trade_id, data["notes"], wallet)
 
     if success:
-        return jsonify({"message": "Notes updated"})
+        return _json_response({"message": "Notes updated"})
     else:
-        return jsonify({"error": ErrorMsg.TRADE_NOT_FOUND}), 404
+        return _error_response(ErrorMsg.TRADE_NOT_FOUND, 404)
 
 
 @app.route("/api/init", methods=["GET"])
@@ -182,12 +423,24 @@ def init_data():
     """Get initial data (roundtrips + assets) in a single call."""
     wallet = get_wallet_from_request()
     if not wallet:
-        return jsonify({"error": ErrorMsg.WALLET_REQUIRED}), 400
+        return _error_response(ErrorMsg.WALLET_REQUIRED)
 
-    return jsonify({
-        "roundtrips": get_round_trips(wallet),
-        "assets": get_unique_assets(wallet)
-    })
+    bundle = get_init_bundle(wallet)
+    round_trips = bundle["roundtrips"]
+    assets = bundle["assets"]
+
+    if len(round_trips) >= STREAM_MIN_ROWS:
+        def generate() -> Iterator[bytes]:
+            yield b'{"roundtrips":'
+            yield from _iter_json_array(round_trips)
+            yield b',"assets":'
+            yield orjson.dumps(assets)
+            yield b"}"
+
+        _encoded_body_drop(("init", wallet.lower()))
+        return Response(generate(), mimetype="application/json")
+
+    return _cached_json_response(("init", wallet.lower()), bundle, round_trips, assets)
 
 
 @app.route("/api/roundtrips", methods=["GET"])
@@ -195,10 +448,10 @@ def get_roundtrips():
     """Get all round-trip trades (paired entry/exit) for a wallet."""
     wallet = get_wallet_from_request()
     if not wallet:
-        return jsonify({"error": ErrorMsg.WALLET_REQUIRED}), 400
+        return _error_response(ErrorMsg.WALLET_REQUIRED)
 
     round_trips = get_round_trips(wallet)
-    return jsonify(round_trips)
+    return _json_list_response(round_trips, ("roundtrips", wallet.lower()))
 
 
 @app.route("/api/assets", methods=["GET"])
@@ -206,10 +459,10 @@ def get_assets():
     """Get list of unique traded assets for a wallet."""
     wallet = get_wallet_from_request()
     if not wallet:
-        return jsonify({"error": ErrorMsg.WALLET_REQUIRED}), 400
+        return _error_response(ErrorMsg.WALLET_REQUIRED)
 
     assets = get_unique_assets(wallet)
-    return jsonify(assets)
+    return _cached_json_response(("assets", wallet.lower()), assets, assets)
 
 
 @app.route("/api/funding", methods=["GET"])
@@ -217,14 +470,14 @@ def get_funding():
     """Get funding payment events."""
     wallet = get_wallet_from_request()
     if not wallet:
-        return jsonify({"error": ErrorMsg.WALLET_NOT_PROVIDED}), 400
+        return _error_response(ErrorMsg.WALLET_NOT_PROVIDED)
 
     try:
         events = fetch_funding_events(wallet)
-        return jsonify(events)
+        return _json_list_response(events)
     except Exception as e:
         logger.exception("Failed to fetch funding for wallet %s", wallet)
-        return jsonify({"error": str(e)}), 500
+        return _error_response(str(e), 500)
 
 
 @app.route("/api/positions", methods=["GET"])
@@ -232,25 +485,22 @@ def get_positions():
     """Get current open positions."""
     wallet = get_wallet_from_request()
     if not wallet:
-        return jsonify({"error": ErrorMsg.WALLET_NOT_PROVIDED}), 400
+        return _error_response(ErrorMsg.WALLET_NOT_PROVIDED)
 
     try:
         positions = fetch_open_positions(wallet)
-        return jsonify(positions)
+        return _json_response(positions)
     except Exception as e:
         logger.exception("Failed to fetch positions for wallet %s", wallet)
-        return jsonify({"error": str(e)}), 500
+        return _error_response(str(e), 500)
 
 
 def _background_sync(wallet_address: str) -> None:
     """Background sync function called by scheduler."""
     try:
         logger.info("Background sync starting for wallet %s", wallet_address[:10])
-        new_trades = fetch_and_parse_trades(wallet_address)
-        existing = load_trades(wallet_address)
-        merged = merge_trades(existing, new_trades)
-        save_trades(merged, wallet_address)
-        logger.info("Background sync completed for wallet %s: %d trades", wallet_address[:10], len(new_trades))
+        result = _sync_wallet(wallet_address)
+        logger.info("Background sync completed for wallet %s: %s", wallet_address[:10], result["message"])
     except Exception as e:
         logger.exception("Background sync failed for wallet %s: %s", wallet_address[:10], e)
 
@@ -262,18 +512,18 @@ def enable_background_sync():
     wallet = data.get("wallet_address")
 
     if not wallet:
-        return jsonify({"error": ErrorMsg.WALLET_NOT_PROVIDED}), 400
+        return _error_response(ErrorMsg.WALLET_NOT_PROVIDED)
 
     if not is_valid_wallet(wallet):
-        return jsonify({"error": ErrorMsg.WALLET_INVALID}), 400
+        return _error_response(ErrorMsg.WALLET_INVALID)
 
     interval = data.get("interval_minutes", 5)
     if not isinstance(interval, int) or interval < 1 or interval > 60:
-        return jsonify({"error": "Interval must be between 1 and 60 minutes"}), 400
+        return _error_response("Interval must be between 1 and 60 minutes")
 
     newly_registered = register_wallet_for_sync(wallet, _background_sync, interval)
 
-    return jsonify({
+    return _json_response({
         "message": "Background sync enabled" if newly_registered else "Background sync already enabled",
         "interval_minutes": interval
     })
@@ -286,14 +536,14 @@ def disable_background_sync():
     wallet = data.get("wallet_address")
 
     if not wallet:
-        return jsonify({"error": ErrorMsg.WALLET_NOT_PROVIDED}), 400
+        return _error_response(ErrorMsg.WALLET_NOT_PROVIDED)
 
     if not is_valid_wallet(wallet):
-        return jsonify({"error": ErrorMsg.WALLET_INVALID}), 400
+        return _error_response(ErrorMsg.WALLET_INVALID)
 
     removed = unregister_wallet(wallet)
 
-    return jsonify({
+    return _json_response({
         "message": "Background sync disabled" if removed else "Background sync was not enabled"
     })
 
@@ -303,9 +553,9 @@ def get_sync_status():
     """Check if background sync is enabled for a wallet."""
     wallet = get_wallet_from_request()
     if not wallet:
-        return jsonify({"error": ErrorMsg.WALLET_REQUIRED}), 400
+        return _error_response(ErrorMsg.WALLET_REQUIRED)
 
-    return jsonify({
+    return _json_response({
         "enabled": is_wallet_registered(wallet)
     })
 
@@ -316,8 +566,6 @@ def get_sync_status():
 
 def _get_sentiment_bot():
     """Get or create the sentiment bot instance."""
-    from sentiment import get_sentiment_bot, create_sentiment_bot
-
     bot = get_sentiment_bot()
     if bot is None and all([DATABASE_URL, ANTHROPIC_API_KEY, DISCORD_WEBHOOK_URL]):
         bot = create_sentiment_bot(
@@ -325,7 +573,8 @@ def _get_sentiment_bot():
             anthropic_api_key=ANTHROPIC_API_KEY,
             discord_webhook_url=DISCORD_WEBHOOK_URL,
             cryptopanic_api_key=CRYPTOPANIC_API_KEY,
-            poll_interval=SENTIMENT_POLL_INTERVAL
+            poll_interval=SENTIMENT_POLL_INTERVAL,
+            prefilter=SENTIMENT_PREFILTER
         )
     return bot
 
@@ -345,95 +594,151 @@ def _check_sentiment_config() -> tuple[bool, str]:
     return True, ""
 
 
+# Config comes from the environment at import time, so validate it once
+_sentiment_config = _check_sentiment_config()
+
+
+# Short-lived LRU of signal endpoint bodies: {(endpoint, *filters): (cached_at, body, etag)}
+SIGNALS_CACHE_TTL = 10  # seconds
+SIGNAL_STATS_CACHE_TTL = 30  # seconds
+SIGNALS_CACHE_MAX_ENTRIES = 256
+_signals_cache: OrderedDict[tuple, tuple[float, bytes, str]] = OrderedDict()
+_signals_cache_lock = threading.Lock()
+
+
+def _signals_cache_get(key: tuple, ttl: int) -> tuple[bytes, str] | None:
+    """Return a cached signals (body, etag) if it is younger than ttl."""
+    with _signals_cache_lock:
+        entry = _signals_cache.get(key)
+        if entry is None:
+            return None
+        if time.time() - entry[0] >= ttl:
+            del _signals_cache[key]
+            return None
+        _signals_cache.move_to_end(key)
+        return entry[1], entry[2]
+
+
+def _signals_cache_set(key: tuple, body: bytes) -> str:
+    """Cache a signals body and return its ETag, evicting the least recently used entry if full."""
+    etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+    with _signals_cache_lock:
+        _signals_cache[key] = (time.time(), body, etag)
+        _signals_cache.move_to_end(key)
+        while len(_signals_cache) > SIGNALS_CACHE_MAX_ENTRIES:
+            _signals_cache.popitem(last=False)
+    return etag
+
+
+def _conditional_json_response(body: bytes, etag: str) -> Response:
+    """Return body with a weak ETag, or 304 if the client already has it."""
+    response = Response(body, mimetype="application/json")
+    response.set_etag(etag, weak=True)
+    return response.make_conditional(request)
+
+
 @app.route("/api/signals", methods=["GET"])
 def get_signals():
     """Get sentiment signal history."""
     # Optional filters
-    limit = request.args.get("limit", 50, type=int)
+    limit = min(request.args.get("limit", 50, type=int), 200)
     sentiment = request.args.get("sentiment")
     asset = request.args.get("asset")
+    asset = asset.upper() if asset else None
     actionable_only = request.args.get("actionable", "false").lower() == "true"
 
-    try:
-        from sentiment import get_sentiment_session, SignalRepository, init_sentiment_db
+    cache_key = ("signals", limit, sentiment, asset, actionable_only)
+    cached = _signals_cache_get(cache_key, SIGNALS_CACHE_TTL)
+    if cached is not None:
+        return _conditional_json_response(*cached)
 
+    try:
         if not init_sentiment_db(DATABASE_URL):
-            return jsonify({"error": "Database not configured"}), 500
+            return _error_response("Database not configured", 500)
 
         session = get_sentiment_session()
         if not session:
-            return jsonify({"error": "Could not connect to database"}), 500
+            return _error_response("Could not connect to database", 500)
 
         try:
             repo = SignalRepository(session)
             signals = repo.get_recent_signals(
-                limit=min(limit, 200),
+                limit=limit,
                 sentiment=sentiment,
-                asset=asset.upper() if asset else None,
+                asset=asset,
                 actionable_only=actionable_only
             )
 
-            return jsonify({
-                "signals": [s.to_dict() for s in signals],
-                "count": len(signals)
-            })
+            # Encode row by row so only one signal dict is alive at a time
+            body = b"".join((
+                b'{"signals":[',
+                b",".join(orjson.dumps(s.to_dict()) for s in signals),
+                b'],"count":%d}' % len(signals),
+            ))
+            etag = _signals_cache_set(cache_key, body)
+            return _conditional_json_response(body, etag)
         finally:
             session.close()
 
     except Exception as e:
         logger.exception("Failed to fetch signals: %s", e)
-        return jsonify({"error": str(e)}), 500
+        return _error_response(str(e), 500)
 
 
 @app.route("/api/signals/stats", methods=["GET"])
 def get_signal_stats():
     """Get sentiment signal statistics."""
-    hours = request.args.get("hours", 24, type=int)
+    hours = min(request.args.get("hours", 24, type=int), 168)  # Max 1 week
 
-    try:
-        from sentiment import get_sentiment_session, SignalRepository, init_sentiment_db
+    cache_key = ("stats", hours)
+    cached = _signals_cache_get(cache_key, SIGNAL_STATS_CACHE_TTL)
+    if cached is not None:
+        return _conditional_json_response(*cached)
 
+    try:
         if not init_sentiment_db(DATABASE_URL):
-            return jsonify({"error": "Database not configured"}), 500
+            return _error_response("Database not configured", 500)
 
         session = get_sentiment_session()
         if not session:
-            return jsonify({"error": "Could not connect to database"}), 500
+            return _error_response("Could not connect to database", 500)
 
         try:
             repo = SignalRepository(session)
-            stats = repo.get_signal_stats(hours=min(hours, 168))  # Max 1 week
-            return jsonify(stats)
+            stats = repo.get_signal_stats(hours=hours)
+            body = orjson.dumps(stats)
+            etag = _signals_cache_set(cache_key, body)
+            return _conditional_json_response(body, etag)
         finally:
             session.close()
 
     except Exception as e:
         logger.exception("Failed to fetch signal stats: %s", e)
-        return jsonify({"error": str(e)}), 500
+        return _error_response(str(e), 500)
 
 
 @app.route("/api/signals/enable", methods=["POST"])
 def enable_sentiment_bot():
     """Enable the sentiment analysis bot."""
     # Check configuration
-    configured, error_msg = _check_sentiment_config()
+    configured, error_msg = _sentiment_config
     if not configured:
-        return jsonify({"error": error_msg}), 400
+        return _error_response(error_msg)
 
     data = request.get_json() or {}
     poll_interval = data.get("poll_interval", SENTIMENT_POLL_INTERVAL)
 
     # Validate interval (1-60 minutes)
     if not isinstance(poll_interval, int) or poll_interval < 60 or poll_interval > 3600:
-        return jsonify({"error": "Poll interval must be between 60 and 3600 seconds"}), 400
+        return _error_response("Poll interval must be between 60 and 3600 seconds")
 
     try:
         bot = _get_sentiment_bot()
         if bot is None:
-            return jsonify({"error": "Failed to create bot instance"}), 500
+            return _error_response("Failed to create bot instance", 500)
 
         if bot.is_running():
-            return jsonify({
+            return _json_response({
                 "message": "Sentiment bot is already running",
                 "stats": bot.get_stats()
             })
@@ -445,52 +750,48 @@ def enable_sentiment_bot():
         success = bot.start(send_startup_message=True)
 
         if success:
-            return jsonify({
+            return _json_response({
                 "message": "Sentiment bot started",
                 "poll_interval": bot.poll_interval,
                 "stats": bot.get_stats()
             })
         else:
-            return jsonify({"error": "Failed to start sentiment bot"}), 500
+            return _error_response("Failed to start sentiment bot", 500)
 
     except Exception as e:
         logger.exception("Failed to enable sentiment bot: %s", e)
-        return jsonify({"error": str(e)}), 500
+        return _error_response(str(e), 500)
 
 
 @app.route("/api/signals/disable", methods=["POST"])
 def disable_sentiment_bot():
     """Disable the sentiment analysis bot."""
     try:
-        from sentiment import get_sentiment_bot
-
         bot = get_sentiment_bot()
         if bot is None or not bot.is_running():
-            return jsonify({"message": "Sentiment bot is not running"})
+            return _json_response({"message": "Sentiment bot is not running"})
 
         success = bot.stop(send_shutdown_message=True)
 
         if success:
-            return jsonify({"message": "Sentiment bot stopped"})
+            return _json_response({"message": "Sentiment bot stopped"})
         else:
-            return jsonify({"error": "Failed to stop sentiment bot"}), 500
+            return _error_response("Failed to stop sentiment bot", 500)
 
     except Exception as e:
         logger.exception("Failed to disable sentiment bot: %s", e)
-        return jsonify({"error": str(e)}), 500
+        return _error_response(str(e), 500)
 
 
 @app.route("/api/signals/status", methods=["GET"])
 def get_sentiment_status():
     """Get sentiment bot status."""
-    configured, error_msg = _check_sentiment_config()
+    configured, error_msg = _sentiment_config
 
     try:
-        from sentiment import get_sentiment_bot
-
         bot = get_sentiment_bot()
 
-        return jsonify({
+        return _json_response({
             "configured": configured,
             "config_error": error_msg if not configured else None,
             "is_running": bot.is_running() if bot else False,
@@ -499,7 +800,7 @@ def get_sentiment_status():
 
     except Exception as e:
         logger.exception("Failed to get sentiment status: %s", e)
-        return jsonify({
+        return _json_response({
             "configured": configured,
             "config_error": error_msg if not configured else None,
             "is_running": False,
@@ -511,66 +812,63 @@ def get_sentiment_status():
 def trigger_sentiment_poll():
     """Trigger an immediate sentiment poll."""
     try:
-        from sentiment import get_sentiment_bot
-
         bot = get_sentiment_bot()
         if bot is None or not bot.is_running():
-            return jsonify({"error": "Sentiment bot is not running"}), 400
+            return _error_response("Sentiment bot is not running")
 
         result = bot.poll_now()
-        return jsonify(result)
+        return _json_response(result)
 
     except Exception as e:
         logger.exception("Failed to trigger poll: %s", e)
-        return jsonify({"error": str(e)}), 500
+        return _error_response(str(e), 500)
 
 
 @app.route("/api/signals/test", methods=["POST"])
 def test_sentiment_alert():
     """Send a test alert to Discord."""
-    configured, error_msg = _check_sentiment_config()
+    configured, error_msg = _sentiment_config
     if not configured:
-        return jsonify({"error": error_msg}), 400
+        return _error_response(error_msg)
 
     try:
         bot = _get_sentiment_bot()
         if bot is None:
-            return jsonify({"error": "Failed to create bot instance"}), 500
-
-        success = bot.send_test_alert()
+            return _error_response("Failed to create bot instance", 500)
 
-        if success:
-            return jsonify({"message": "Test alert sent to Discord"})
+        # Delivered by the webhook's background sender
+        if bot.send_test_alert():
+            return _json_response({"message": "Test alert queued for Discord"}, 202)
         else:
-            return jsonify({"error": "Failed to send test alert"}), 500
+            return _error_response("Failed to queue test alert", 503)
 
     except Exception as e:
         logger.exception("Failed to send test alert: %s", e)
-        return jsonify({"error": str(e)}), 500
+        return _error_response(str(e), 500)
 
 
 @app.route("/api/signals/webhook/test", methods=["POST"])
 def test_discord_webhook():
     """Test Discord webhook connection."""
-    configured, error_msg = _check_sentiment_config()
+    configured, error_msg = _sentiment_config
     if not configured:
-        return jsonify({"error": error_msg}), 400
+        return _error_response(error_msg)
 
     try:
         bot = _get_sentiment_bot()
         if bot is None:
-            return jsonify({"error": "Failed to create bot instance"}), 500
+            return _error_response("Failed to create bot instance", 500)
 
         success = bot.test_discord()
 
         if success:
-            return jsonify({"message": "Discord webhook is working"})
+            return _json_response({"message": "Discord webhook is working"})
         else:
-            return jsonify({"error": "Discord webhook test failed"}), 500
+            return _error_response("Discord webhook test failed", 500)
 
     except Exception as e:
         logger.exception("Failed to test webhook: %s", e)
-        return jsonify({"error": str(e)}), 500
+        return _error_response(str(e), 500)
 
 
 @app.route("/api/signals/debug", methods=["GET"])
@@ -579,9 +877,6 @@ def debug_sentiment():
     analyze_sample = request.args.get("analyze", "false").lower() == "true"
 
     try:
-        from sentiment import NewsAggregator, SentimentAnalyzer
-        from sentiment import get_sentiment_session, SignalRepository, init_sentiment_db
-
         result = {
             "cryptopanic_configured": bool(CRYPTOPANIC_API_KEY),
             "anthropic_configured": bool(ANTHROPIC_API_KEY),
@@ -657,61 +952,42 @@ def debug_sentiment():
             twitter_accounts=TWITTER_ACCOUNTS
         )
 
-        # Fetch from each source
-        all_items = []
-
-        # CryptoPanic
-        try:
-            cp_items = aggregator.fetch_cryptopanic(limit=10)
-            result["news_sources"].append({
-                "source": "cryptopanic",
-                "status": "ok",
-                "count": len(cp_items),
-                "items": [{"id": i.id, "title": i.title[:80], "assets": i.currencies, "published": i.published_at.isoformat()} for i in cp_items[:5]]
-            })
-            all_items.extend(cp_items)
-        except Exception as e:
-            result["news_sources"].append({
-                "source": "cryptopanic",
-                "status": "error",
-                "error": str(e)
-            })
-
-        # CryptoCompare
-        try:
-            cc_items = aggregator.fetch_cryptonews(limit=10)
-            result["news_sources"].append({
-                "source": "cryptocompare",
-                "status": "ok",
-                "count": len(cc_items),
-                "items": [{"id": i.id, "title": i.title[:80], "assets": i.currencies, "published": i.published_at.isoformat()} for i in cc_items[:5]]
-            })
-            all_items.extend(cc_items)
-        except Exception as e:
-            result["news_sources"].append({
-                "source": "cryptocompare",
-                "status": "error",
-                "error": str(e)
-            })
-
+        # Fetch from each source concurrently; results are reported in source order
+        sources = [
+            ("cryptopanic", aggregator.fetch_cryptopanic),
+            ("cryptocompare", aggregator.fetch_cryptonews),
+        ]
         # Twitter (via Nitter RSS)
         if TWITTER_ENABLED:
-            try:
-                tw_items = aggregator.fetch_twitter(limit=10)
-                result["news_sources"].append({
-                    "source": "twitter",
+            sources.append(("twitter", aggregator.fetch_twitter))
+
+        all_items = []
+        with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+            futures = [(name, executor.submit(fetch, limit=10)) for name, fetch in sources]
+            for name, future in futures:
+                try:
+                    items = future.result()
+                except Exception as e:
+                    result["news_sources"].append({
+                        "source": name,
+                        "status": "error",
+                        "error": str(e)
+                    })
+                    continue
+
+                source_result = {
+                    "source": name,
                     "status": "ok",
-                    "count": len(tw_items),
-                    "accounts": TWITTER_ACCOUNTS,
-                    "items": [{"id": i.id, "title": i.title[:80], "assets": i.currencies, "published": i.published_at.isoformat(), "source_name": i.source_name} for i in tw_items[:5]]
-                })
-                all_items.extend(tw_items)
-            except Exception as e:
-                result["news_sources"].append({
-                    "source": "twitter",
-                    "status": "error",
-                    "error": str(e)
-                })
+                    "count": len(items),
+                }
+                samples = [{"id": i.id, "title": i.title[:80], "assets": i.currencies, "published": i.published_at.isoformat()} for i in items[:5]]
+                if name == "twitter":
+                    source_result["accounts"] = TWITTER_ACCOUNTS
+                    for sample, item in zip(samples, items):
+                        sample["source_name"] = item.source_name
+                source_result["items"] = samples
+                result["news_sources"].append(source_result)
+                all_items.extend(items)
 
         result["total_fetched"] = len(all_items)
 
@@ -721,7 +997,8 @@ def debug_sentiment():
             if session:
                 try:
                     repo = SignalRepository(session)
-                    new_items = [item for item in all_items if not repo.news_exists(item.id)]
+                    existing = repo.news_exists_many([item.id for item in all_items])
+                    new_items = [item for item in all_items if item.id not in existing]
                     result["new_items"] = len(new_items)
                     result["already_processed"] = len(all_items) - len(new_items)
 
@@ -825,11 +1102,11 @@ Return JSON with: sentiment, confidence, signal_strength, price_impact, timefram
                 finally:
                     session.close()
 
-        return jsonify(result)
+        return _json_response(result)
 
     except Exception as e:
         logger.exception("Debug endpoint error: %s", e)
-        return jsonify({"error": str(e)}), 500
+        return _error_response(str(e), 500)
 
 
 if __name__ == "__main__":
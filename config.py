@@ -32,6 +32,10 @@ CRYPTOPANIC_API_KEY = os.getenv("CRYPTOPANIC_API_KEY", "")
 # Sentiment polling interval in seconds (default: 5 minutes)
 SENTIMENT_POLL_INTERVAL = int(os.getenv("SENTIMENT_POLL_INTERVAL", "300"))
 
+# Skip Claude for headlines with no market-moving keywords (saves API calls,
+# but a headline the keyword list misses is never analyzed)
+SENTIMENT_PREFILTER = os.getenv("SENTIMENT_PREFILTER", "false").lower() == "true"
+
 # Sentiment bot display name
 SENTIMENT_BOT_NAME = os.getenv("SENTIMENT_BOT_NAME", "HL Sentiment Bot")
 
@@ -55,3 +55,4 @@ class ErrorMsg:
     WALLET_INVALID = "Invalid wallet address format"
     NOTES_REQUIRED = "Notes field required"
     TRADE_NOT_FOUND = "Trade not found"
+    SYNC_JOB_NOT_FOUND = "Sync job not found"
@@ -1,22 +1,36 @@
+import logging
+import threading
+import time
+import orjson
 import requests
-from functools import lru_cache
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
 from config import HYPERLIQUID_API_URL
 from constants import (
     Direction, Action, MarketType, ApiType, FillSide,
     API_DIRECTION_LONG, API_DIRECTION_OPEN, SPOT_ASSET_PREFIX
 )
 
+logger = logging.getLogger(__name__)
+
 # Request configuration
-REQUEST_TIMEOUT = 15  # seconds
+# (connect, read) seconds: fail fast on an unreachable host, but let slow
+# history responses keep streaming
+CONNECT_TIMEOUT = 3
+READ_TIMEOUT = 12
+REQUEST_TIMEOUT = (CONNECT_TIMEOUT, READ_TIMEOUT)
 MAX_RETRIES = 3
 RETRY_BACKOFF = 0.5  # exponential backoff factor
 
-# Create a session with retry logic
+# Connection pool configuration (parallel fetches share keep-alive connections)
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 16
+
+# Create a session with retry logic (called once, for the module-level session)
 def _get_http_session() -> requests.Session:
-    """Create a requests session with retry and timeout configuration."""
+    """Create a requests session with retry, timeout and connection pool configuration."""
     session = requests.Session()
     retry_strategy = Retry(
         total=MAX_RETRIES,
@@ -24,37 +38,138 @@ def _get_http_session() -> requests.Session:
         status_forcelist=[429, 500, 502, 503, 504],
         allowed_methods=["POST", "GET"]
     )
-    adapter = HTTPAdapter(max_retries=retry_strategy)
+    adapter = HTTPAdapter(
+        max_retries=retry_strategy,
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE
+    )
     session.mount("https://", adapter)
     session.mount("http://", adapter)
     return session
 
 
+# Shared session so every call reuses pooled TCP/TLS connections
+_http_session = _get_http_session()
+
+# Shared worker threads for parallel API calls (avoids spawning threads per request)
+FETCH_WORKERS = 8
+_fetch_executor = ThreadPoolExecutor(max_workers=FETCH_WORKERS, thread_name_prefix="hl-fetch")
+
+
+# Response cache TTLs: mids move constantly but UI requests arrive in bursts;
+# spot metadata rarely changes
+ALL_MIDS_CACHE_TTL = 2  # seconds
+SPOT_META_CACHE_TTL = 3600  # seconds
+
+# Cached API results: {key: (fetched_at, result)}
+_response_cache: dict[str, tuple[float, object]] = {}
+# One lock per cache key so concurrent misses share a single upstream call
+_refresh_locks: dict[str, threading.Lock] = {}
+
+
+# History endpoints that can return megabytes of JSON
+_LARGE_RESPONSE_TYPES = (ApiType.USER_FILLS, ApiType.USER_FUNDING)
+
+
 def _api_request(payload: dict) -> dict | list:
     """Make an API request with timeout and retry handling."""
-    session = _get_http_session()
-    response = session.post(
+    if payload.get("type") in _LARGE_RESPONSE_TYPES:
+        # Read the body in one call instead of requests' 10KB iter_content
+        # chunks and join; orjson takes the raw bytes without decoding to str
+        with _http_session.post(
+            HYPERLIQUID_API_URL,
+            data=orjson.dumps(payload),
+            headers={"Content-Type": "application/json"},
+            timeout=REQUEST_TIMEOUT,
+            stream=True
+        ) as response:
+            response.raise_for_status()
+            return orjson.loads(response.raw.read(decode_content=True))
+
+    response = _http_session.post(
         HYPERLIQUID_API_URL,
-        json=payload,
+        data=orjson.dumps(payload),
         headers={"Content-Type": "application/json"},
         timeout=REQUEST_TIMEOUT
     )
     response.raise_for_status()
-    return response.json()
+    return orjson.loads(response.content)
+
+
+def _cached_call(key: str, ttl: float, fetch: Callable[[], object]):
+    """
+    Return a cached result, calling fetch() when it is missing or older than ttl.
+
+    Only one thread refreshes a key at a time. Callers that find a stale
+    result while a refresh is in flight get the stale result immediately;
+    callers with nothing cached wait for the refresh and share its result.
+    If fetch() fails and a previous result exists, that stale result is
+    returned instead so a transient API error doesn't break the page.
+    """
+    entry = _response_cache.get(key)
+    if entry is not None and time.time() - entry[0] < ttl:
+        return entry[1]
+
+    lock = _refresh_locks.setdefault(key, threading.Lock())
+    if not lock.acquire(blocking=entry is None):
+        return entry[1]
+
+    try:
+        # Another thread may have refreshed while we waited for the lock
+        entry = _response_cache.get(key)
+        if entry is not None and time.time() - entry[0] < ttl:
+            return entry[1]
+
+        try:
+            result = fetch()
+        except Exception as e:
+            if entry is None:
+                raise
+            logger.warning("Hyperliquid %s fetch failed, serving stale copy: %s", key, e)
+            return entry[1]
+
+        _response_cache[key] = (time.time(), result)
+        return result
+    finally:
+        lock.release()
 
 
-@lru_cache(maxsize=1)
 def fetch_spot_meta() -> dict:
     """
     Fetch spot metadata to get token names for spot indices.
-    Results are cached using lru_cache for thread-safety.
+    Results are cached for SPOT_META_CACHE_TTL seconds.
 
     Returns:
         Dict mapping spot index (e.g., "107") to token name (e.g., "HYPE/USDC")
     """
+    return _cached_call("spot_meta", SPOT_META_CACHE_TTL, _build_spot_name_map)
+
+
+def prefetch_spot_meta() -> None:
+    """
+    Warm the spot metadata cache in the background.
+
+    Round-trip building resolves spot names through fetch_spot_meta, so
+    fetching it at startup keeps the first page load from waiting on it and
+    leaves a keep-alive connection to the API open in the pool.
+    """
+    def _prefetch() -> None:
+        try:
+            fetch_spot_meta()
+        except Exception as e:
+            logger.warning("Spot metadata prefetch failed: %s", e)
+
+    _fetch_executor.submit(_prefetch)
+
+
+def _build_spot_name_map() -> dict:
+    """Fetch spot metadata and build the spot index to name mapping."""
     data = _api_request({"type": ApiType.SPOT_META})
     spot_name_map = {}
 
+    # Index token names once so each spot pair resolves with two dict lookups
+    token_names = {t.get("index"): t.get("name") for t in data.get("tokens", [])}
+
     # Build mapping from spot index to name
     # Universe contains spot pairs with their names
     universe = data.get("universe", [])
@@ -67,17 +182,11 @@ def fetch_spot_meta() -> dict:
                 tokens = spot.get("tokens", [])
                 # tokens[0] is base, tokens[1] is quote (usually USDC = 0)
                 # We need token metadata to resolve names
-                token_list = data.get("tokens", [])
-                if len(tokens) >= 2 and token_list:
+                if len(tokens) >= 2 and token_names:
                     base_idx = tokens[0]
                     quote_idx = tokens[1]
-                    base_name = None
-                    quote_name = None
-                    for t in token_list:
-                        if t.get("index") == base_idx:
-                            base_name = t.get("name")
-                        if t.get("index") == quote_idx:
-                            quote_name = t.get("name")
+                    base_name = token_names.get(base_idx)
+                    quote_name = token_names.get(quote_idx)
                     if base_name:
                         name = f"{base_name}/USDC" if quote_idx == 0 else f"{base_name}/{quote_name or '?'}"
             spot_name_map[str(index)] = name
@@ -107,6 +216,9 @@ def fetch_user_fills(wallet_address: str, aggregate_by_time: bool = True) -> lis
     """
     Fetch trading fills (trade history) for a wallet address from Hyperliquid.
 
+    The API returns at most the 2000 most recent fills per call, which
+    parse_fills_to_trades handles in a few milliseconds on one thread.
+
     Args:
         wallet_address: The user's Hyperliquid wallet address
         aggregate_by_time: If True, combines partial fills from the same order
@@ -121,6 +233,81 @@ def fetch_user_fills(wallet_address: str, aggregate_by_time: bool = True) -> lis
     })
 
 
+# Enum members resolved once at import; the parse loop only does dict lookups
+_LONG, _SHORT = Direction.LONG, Direction.SHORT
+_OPEN, _CLOSE = Action.OPEN, Action.CLOSE
+
+# Spot has no shorting: Buy = open long, Sell = close long
+_SPOT_BUY = (_LONG, _OPEN)
+_SPOT_SELL = (_LONG, _CLOSE)
+
+# Common perp fill directions -> (direction, action). Anything else (position
+# flips like "Long > Short", liquidations) falls back to substring checks.
+_PERP_DIRECTIONS = {
+    "Open Long": (_LONG, _OPEN),
+    "Open Short": (_SHORT, _OPEN),
+    "Close Long": (_LONG, _CLOSE),
+    "Close Short": (_SHORT, _CLOSE),
+}
+
+
+def parse_fills_to_trades(fills: list) -> list:
+    """
+    Convert Hyperliquid fill objects to our trade format in a single pass.
+
+    Args:
+        fills: Raw fill objects from Hyperliquid API
+
+    Returns:
+        List of normalized trade objects for our journal
+    """
+    # Bind hot names locally; this loop runs once per fill in the history
+    _float = float
+    spot_prefix = SPOT_ASSET_PREFIX
+    perp_directions = _PERP_DIRECTIONS
+    buy = FillSide.BUY
+    spot_buy, spot_sell = _SPOT_BUY, _SPOT_SELL
+
+    trades = []
+    append = trades.append
+    for fill in fills:
+        get = fill.get
+        asset = get("coin", "")
+        side = get("side", "")  # B = buy, A = sell
+
+        if asset.startswith(spot_prefix):
+            direction, action = spot_buy if side == buy else spot_sell
+        else:
+            # Perp trading: Use the dir field
+            api_direction = get("dir", "")
+            known = perp_directions.get(api_direction)
+            if known is not None:
+                direction, action = known
+            else:
+                direction = _LONG if API_DIRECTION_LONG in api_direction else _SHORT
+                action = _OPEN if API_DIRECTION_OPEN in api_direction else _CLOSE
+
+        order_id = get("oid")
+        append({
+            "id": str(get("tid", get("oid", ""))),
+            "asset": asset,
+            "direction": direction,
+            "action": action,
+            "price": _float(get("px", 0)),
+            "size": _float(get("sz", 0)),
+            "pnl": _float(get("closedPnl", 0)),
+            "fee": _float(get("fee", 0)),
+            "timestamp": get("time", 0),
+            "hash": get("hash", ""),
+            "order_id": order_id,
+            "side": side,
+            "start_position": _float(get("startPosition", 0)),
+            "notes": ""  # User can add notes later
+        })
+
+    return trades
+
+
 def parse_fill_to_trade(fill: dict) -> dict:
     """
     Convert a Hyperliquid fill object to our trade format.
@@ -131,37 +318,7 @@ def parse_fill_to_trade(fill: dict) -> dict:
     Returns:
         Normalized trade object for our journal
     """
-    asset = fill.get("coin", "")
-    is_spot = asset.startswith(SPOT_ASSET_PREFIX)
-    side = fill.get("side", "")  # B = buy, A = sell
-
-    if is_spot:
-        # Spot trading: Buy = open long, Sell = close long
-        # Spot doesn't have shorting
-        is_long = True
-        is_open = side == FillSide.BUY
-    else:
-        # Perp trading: Use the dir field
-        direction = fill.get("dir", "")
-        is_long = API_DIRECTION_LONG in direction
-        is_open = API_DIRECTION_OPEN in direction
-
-    return {
-        "id": str(fill.get("tid", fill.get("oid", ""))),
-        "asset": asset,
-        "direction": Direction.LONG if is_long else Direction.SHORT,
-        "action": Action.OPEN if is_open else Action.CLOSE,
-        "price": float(fill.get("px", 0)),
-        "size": float(fill.get("sz", 0)),
-        "pnl": float(fill.get("closedPnl", 0)),
-        "fee": float(fill.get("fee", 0)),
-        "timestamp": fill.get("time", 0),
-        "hash": fill.get("hash", ""),
-        "order_id": fill.get("oid"),
-        "side": side,
-        "start_position": float(fill.get("startPosition", 0)),
-        "notes": ""  # User can add notes later
-    }
+    return parse_fills_to_trades([fill])[0]
 
 
 def fetch_and_parse_trades(wallet_address: str) -> list:
@@ -175,7 +332,7 @@ def fetch_and_parse_trades(wallet_address: str) -> list:
         List of parsed trade objects
     """
     fills = fetch_user_fills(wallet_address)
-    return [parse_fill_to_trade(fill) for fill in fills]
+    return parse_fills_to_trades(fills)
 
 
 def fetch_user_funding(wallet_address: str, start_time: int = 0) -> list:
@@ -235,11 +392,16 @@ def fetch_funding_events(wallet_address: str) -> list:
 def fetch_all_mids() -> dict:
     """
     Fetch current mid prices for all assets.
+    Results are cached for ALL_MIDS_CACHE_TTL seconds.
 
     Returns:
         Dict mapping asset name to mid price
     """
-    return _api_request({"type": ApiType.ALL_MIDS})
+    return _cached_call(
+        "all_mids",
+        ALL_MIDS_CACHE_TTL,
+        lambda: _api_request({"type": ApiType.ALL_MIDS})
+    )
 
 
 def fetch_open_orders(wallet_address: str) -> list:
@@ -266,6 +428,15 @@ def _fetch_clearinghouse_state(wallet_address: str) -> dict:
     })
 
 
+# Hyperliquid trigger order types -> position field they set
+_TP_SL_ORDER_FIELDS = {
+    "Take Profit Market": "take_profit",
+    "Take Profit Limit": "take_profit",
+    "Stop Market": "stop_loss",
+    "Stop Limit": "stop_loss",
+}
+
+
 def fetch_open_positions(wallet_address: str) -> list:
     """
     Fetch current open positions from clearinghouse state.
@@ -276,46 +447,34 @@ def fetch_open_positions(wallet_address: str) -> list:
     Returns:
         List of open position objects
     """
-    # Parallel fetch: clearinghouse state, all mids, and open orders
-    with ThreadPoolExecutor(max_workers=3) as executor:
-        futures = {
-            executor.submit(_fetch_clearinghouse_state, wallet_address): 'state',
-            executor.submit(fetch_all_mids): 'mids',
-            executor.submit(fetch_open_orders, wallet_address): 'orders'
-        }
-
-        results = {}
-        for future in as_completed(futures):
-            key = futures[future]
-            try:
-                results[key] = future.result()
-            except Exception as e:
-                # If any call fails, raise the error
-                raise e
-
-    data = results['state']
-    all_mids = results['mids']
-    open_orders = results['orders']
+    # Parallel fetch: mids and open orders on the shared pool while the
+    # calling thread fetches clearinghouse state; any failure is re-raised
+    mids_future = _fetch_executor.submit(fetch_all_mids)
+    orders_future = _fetch_executor.submit(fetch_open_orders, wallet_address)
+    data = _fetch_clearinghouse_state(wallet_address)
+    all_mids = mids_future.result()
+    open_orders = orders_future.result()
 
     # Group TP/SL orders by asset
     tp_sl_by_asset = {}
     for order in open_orders:
-        asset = order.get("coin", "")
-        order_type = order.get("orderType", "")
         trigger_px = order.get("triggerPx")
-        is_tp_sl = order.get("isPositionTpsl", False)
-
-        if not trigger_px or not is_tp_sl:
+        if not trigger_px or not order.get("isPositionTpsl", False):
             continue
 
-        if asset not in tp_sl_by_asset:
-            tp_sl_by_asset[asset] = {"take_profit": None, "stop_loss": None}
-
-        price = float(trigger_px)
-        if "Take Profit" in order_type:
-            tp_sl_by_asset[asset]["take_profit"] = price
-        elif "Stop" in order_type:
-            tp_sl_by_asset[asset]["stop_loss"] = price
+        order_type = order.get("orderType", "")
+        field = _TP_SL_ORDER_FIELDS.get(order_type)
+        if field is None:
+            # Unlisted trigger type: classify by name as before
+            if "Take Profit" in order_type:
+                field = "take_profit"
+            elif "Stop" in order_type:
+                field = "stop_loss"
+            else:
+                continue
+
+        tp_sl = tp_sl_by_asset.setdefault(order.get("coin", ""), {"take_profit": None, "stop_loss": None})
+        tp_sl[field] = float(trigger_px)
 
     positions = []
     asset_positions = data.get("assetPositions", [])
@@ -344,7 +503,7 @@ def fetch_open_positions(wallet_address: str) -> list:
         positions.append({
             "asset": asset,
             "size": abs(size),
-            "direction": Direction.LONG if is_long else Direction.SHORT,
+            "direction": _LONG if is_long else _SHORT,
             "entry_price": entry_px,
             "current_price": current_price,
             "unrealized_pnl": unrealized_pnl,
@@ -3,11 +3,20 @@
 import logging
 import threading
 import os
-from typing import Callable
+import tempfile
+import time
+import uuid
+from typing import Callable, IO
+from apscheduler.events import EVENT_JOB_ERROR, EVENT_JOB_MISSED, JobExecutionEvent
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.executors.pool import ThreadPoolExecutor
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
 logger = logging.getLogger(__name__)
 
 # Scheduler instance
@@ -18,10 +27,26 @@ _initialized = False
 # Default sync interval in minutes
 DEFAULT_SYNC_INTERVAL = 5
 
-# Track registered wallets for background sync
-_registered_wallets: set[str] = set()
+# Worker threads shared by every wallet's sync job; extra due jobs queue
+# for a free worker rather than each wallet getting a thread
+SYNC_WORKERS = 2
+
+# Cross-process lock so only one gunicorn worker runs the scheduler
+SCHEDULER_LOCK_FILE = os.path.join(tempfile.gettempdir(), "hl_journal_scheduler.lock")
+_lock_file: IO | None = None
+
+# Track registered wallets for background sync. Writers swap in a new
+# frozenset under _wallet_lock; readers use the current snapshot lock-free.
+_registered_wallets: frozenset[str] = frozenset()
 _wallet_lock = threading.Lock()
 
+# One-off sync jobs: {job_id: {"wallet", "state", "started_at", "finished_at", ...result}}
+_sync_jobs: dict[str, dict] = {}
+_sync_jobs_lock = threading.Lock()
+SYNC_JOB_RETENTION = 600  # seconds to keep finished job results
+SYNC_JOB_TIMEOUT = 900  # seconds before a job still "running" is presumed lost
+SYNC_JOB_PREFIX = "sync_once_"
+
 
 def get_scheduler() -> BackgroundScheduler:
     """Get or create the background scheduler (singleton)."""
@@ -30,7 +55,7 @@ def get_scheduler() -> BackgroundScheduler:
         if _scheduler is None:
             # Use a small thread pool to prevent resource exhaustion
             executors = {
-                'default': ThreadPoolExecutor(max_workers=2)
+                'default': ThreadPoolExecutor(max_workers=SYNC_WORKERS)
             }
             _scheduler = BackgroundScheduler(
                 executors=executors,
@@ -40,32 +65,92 @@ def get_scheduler() -> BackgroundScheduler:
                     'misfire_grace_time': 120  # Allow 2min grace period for misfires
                 }
             )
+            _scheduler.add_listener(_on_job_failed, EVENT_JOB_MISSED | EVENT_JOB_ERROR)
         return _scheduler
 
 
-def start_scheduler() -> None:
-    """Start the background scheduler if not already running."""
+def _on_job_failed(event: JobExecutionEvent) -> None:
+    """Mark a one-off sync job failed when APScheduler skips or aborts its run."""
+    if not event.job_id.startswith(SYNC_JOB_PREFIX):
+        return
+    if event.code == EVENT_JOB_MISSED:
+        error = "Sync was skipped because the scheduler was too busy"
+    else:
+        error = str(event.exception) or "Sync failed"
+    _fail_sync_job(event.job_id[len(SYNC_JOB_PREFIX):], error)
+
+
+def _fail_sync_job(job_id: str, error: str) -> None:
+    """Record a failure for a one-off sync job that is still running."""
+    with _sync_jobs_lock:
+        job = _sync_jobs.get(job_id)
+        if job is not None and job["state"] == "running":
+            job.update(state="error", error=error, finished_at=time.time())
+
+
+def _acquire_process_lock() -> bool:
+    """Take the scheduler file lock without blocking. Returns False if another process holds it."""
+    global _lock_file
+    if fcntl is None:
+        return True  # No flock on this platform; rely on the single-worker setup
+
+    lock_file = open(SCHEDULER_LOCK_FILE, "w")
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock_file.close()
+        return False
+
+    _lock_file = lock_file
+    return True
+
+
+def _release_process_lock() -> None:
+    """Release the scheduler file lock if this process holds it."""
+    global _lock_file
+    if _lock_file is not None:
+        fcntl.flock(_lock_file, fcntl.LOCK_UN)
+        _lock_file.close()
+        _lock_file = None
+
+
+def start_scheduler() -> bool:
+    """
+    Start the background scheduler if not already running.
+
+    Only the process holding the scheduler file lock starts it, so multiple
+    gunicorn workers don't each run every sync job.
+
+    Returns:
+        True if this process owns the running scheduler
+    """
     global _initialized
     with _scheduler_lock:
         if _initialized:
             logger.debug("Scheduler already initialized, skipping")
-            return
+            return _lock_file is not None or fcntl is None
+        if not _acquire_process_lock():
+            logger.info("Scheduler lock held by another process, not starting (PID: %s)", os.getpid())
+            return False
         _initialized = True
 
     scheduler = get_scheduler()
     if not scheduler.running:
         scheduler.start()
         logger.info("Background scheduler started (PID: %s)", os.getpid())
+    return True
 
 
 def stop_scheduler() -> None:
     """Stop the background scheduler gracefully."""
-    global _scheduler
+    global _scheduler, _initialized
     with _scheduler_lock:
         if _scheduler and _scheduler.running:
             _scheduler.shutdown(wait=True)
             logger.info("Background scheduler stopped")
             _scheduler = None
+        _initialized = False
+        _release_process_lock()
 
 
 def register_wallet_for_sync(
@@ -84,25 +169,31 @@ def register_wallet_for_sync(
     Returns:
         True if newly registered, False if already registered
     """
+    global _registered_wallets
     wallet = wallet_address.lower()
 
     with _wallet_lock:
         if wallet in _registered_wallets:
             return False
-        _registered_wallets.add(wallet)
+        _registered_wallets = _registered_wallets | {wallet}
 
     scheduler = get_scheduler()
     job_id = f"sync_{wallet}"
 
-    # Add job for this wallet
-    scheduler.add_job(
-        func=sync_func,
-        trigger=IntervalTrigger(minutes=interval_minutes),
-        args=[wallet],
-        id=job_id,
-        replace_existing=True,
-        name=f"Sync trades for {wallet[:10]}..."
-    )
+    # The registry check above proves the job is new, so skip the job store's
+    # replace-existing lookup; undo the registration if the add fails
+    try:
+        scheduler.add_job(
+            func=sync_func,
+            trigger=IntervalTrigger(minutes=interval_minutes),
+            args=[wallet],
+            id=job_id,
+            name=f"Sync trades for {wallet[:10]}..."
+        )
+    except Exception:
+        with _wallet_lock:
+            _registered_wallets = _registered_wallets - {wallet}
+        raise
 
     logger.info("Registered wallet %s for background sync every %d minutes", wallet[:10], interval_minutes)
     return True
@@ -118,12 +209,13 @@ def unregister_wallet(wallet_address: str) -> bool:
     Returns:
         True if removed, False if not found
     """
+    global _registered_wallets
     wallet = wallet_address.lower()
 
     with _wallet_lock:
         if wallet not in _registered_wallets:
             return False
-        _registered_wallets.discard(wallet)
+        _registered_wallets = _registered_wallets - {wallet}
 
     scheduler = get_scheduler()
     job_id = f"sync_{wallet}"
@@ -138,11 +230,84 @@ def unregister_wallet(wallet_address: str) -> bool:
 
 def get_registered_wallets() -> list[str]:
     """Get list of wallets registered for background sync."""
-    with _wallet_lock:
-        return list(_registered_wallets)
+    return list(_registered_wallets)
 
 
 def is_wallet_registered(wallet_address: str) -> bool:
     """Check if a wallet is registered for background sync."""
-    with _wallet_lock:
-        return wallet_address.lower() in _registered_wallets
+    return wallet_address.lower() in _registered_wallets
+
+
+def _run_sync_job(job_id: str, wallet: str, sync_func: Callable[[str], dict]) -> None:
+    """Run a one-off sync and record its outcome."""
+    try:
+        update = {"state": "done", **sync_func(wallet)}
+    except Exception as e:
+        logger.exception("Sync job %s failed for wallet %s", job_id, wallet[:10])
+        update = {"state": "error", "error": str(e)}
+
+    with _sync_jobs_lock:
+        job = _sync_jobs.get(job_id)
+        if job is not None:
+            job.update(update, finished_at=time.time())
+
+
+def submit_sync_job(wallet_address: str, sync_func: Callable[[str], dict]) -> str | None:
+    """
+    Run a one-off sync for a wallet on the scheduler's thread pool.
+
+    Args:
+        wallet_address: The wallet to sync
+        sync_func: Function that syncs the wallet and returns a result dict
+
+    Returns:
+        Job ID to poll with get_sync_job, or None if the scheduler isn't running
+        or the job couldn't be scheduled
+    """
+    wallet = wallet_address.lower()
+    scheduler = get_scheduler()
+    if not scheduler.running:
+        return None
+
+    now = time.time()
+    with _sync_jobs_lock:
+        # Drop finished jobs past retention, and running jobs that never
+        # reported back (their worker is gone or the run was lost)
+        for job_id, job in list(_sync_jobs.items()):
+            if job["state"] == "running":
+                expired = now - job["started_at"] > SYNC_JOB_TIMEOUT
+            else:
+                expired = now - job["finished_at"] > SYNC_JOB_RETENTION
+            if expired:
+                del _sync_jobs[job_id]
+
+        # Reuse an in-flight sync for the same wallet
+        for job_id, job in _sync_jobs.items():
+            if job["state"] == "running" and job["wallet"] == wallet:
+                return job_id
+
+        job_id = uuid.uuid4().hex
+        _sync_jobs[job_id] = {"wallet": wallet, "state": "running", "started_at": now, "finished_at": None}
+
+    try:
+        scheduler.add_job(
+            func=_run_sync_job,
+            args=[job_id, wallet, sync_func],
+            id=f"{SYNC_JOB_PREFIX}{job_id}",
+            name=f"One-off sync for {wallet[:10]}..."
+        )
+    except Exception:
+        logger.exception("Failed to schedule sync job for wallet %s", wallet[:10])
+        with _sync_jobs_lock:
+            _sync_jobs.pop(job_id, None)
+        return None
+    return job_id
+
+
+def get_sync_job(job_id: str) -> dict | None:
+    """Get the state of a one-off sync job, or None if unknown or expired."""
+    with _sync_jobs_lock:
+        job = _sync_jobs.get(job_id)
+        if job is None:
+            return None
+        return {k: v for k, v in job.items() if k not in ("wallet", "started_at", "finished_at")}
@@ -7,12 +7,18 @@ Fetches news from multiple sources:
 
 import hashlib
 import logging
+import re
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Iterable, Optional
 from enum import Enum
+from operator import attrgetter
 
+import orjson
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
@@ -24,16 +30,30 @@ REQUEST_TIMEOUT = 10
 MAX_RETRIES = 2
 RETRY_BACKOFF = 0.3
 
+# Worker threads for fetching news sources in parallel (one per source)
+FETCH_WORKERS = 3
+
+# Assets taken from one headline's text; most news mentions three or fewer
+MAX_ASSETS_PER_ITEM = 5
+
+# Seen news IDs remembered for in-memory dedup (oldest are evicted first)
+MAX_SEEN_URLS = 10_000
+
 
 class NewsSource(str, Enum):
-    """News source identifiers."""
+    """News source identifiers.
+
+    Kept as a str enum: the value is what is stored in sentiment_news.source
+    and returned by the API, and members are shared singletons, so an int
+    enum would save nothing per NewsItem.
+    """
     CRYPTOPANIC = "cryptopanic"
     CRYPTONEWS = "cryptonews"
 
 
-@dataclass
+@dataclass(slots=True)
 class NewsItem:
-    """Normalized news item from any source."""
+    """Normalized news item from any source (slotted: many are held per poll)."""
     id: str                          # Unique hash of URL
     title: str                       # Headline
     url: str                         # Original article URL
@@ -79,8 +99,52 @@ def _get_http_session() -> requests.Session:
     return session
 
 
+# Shared by every aggregator instance so pooled keep-alive connections
+# survive across polls and the per-request aggregators in the debug endpoint
+_http_session = _get_http_session()
+
+# Shared worker threads for source fetches (avoids spawning threads per poll)
+_fetch_executor = ThreadPoolExecutor(max_workers=FETCH_WORKERS, thread_name_prefix="news-fetch")
+
+
+def _remember_seen(seen: OrderedDict[str, None], ids: Iterable[str]) -> None:
+    """Add ids to a seen-ID window, evicting the oldest beyond MAX_SEEN_URLS."""
+    for item_id in ids:
+        seen[item_id] = None
+    while len(seen) > MAX_SEEN_URLS:
+        seen.popitem(last=False)
+
+
+def _parse_iso_timestamp(value: str) -> datetime:
+    """
+    Parse an ISO 8601 timestamp, falling back to now if it is malformed.
+
+    Python 3.11+ parses a trailing "Z" directly in C; the rewrite to
+    "+00:00" is only needed on older interpreters.
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        pass
+    if value.endswith("Z"):
+        try:
+            return datetime.fromisoformat(value[:-1] + "+00:00")
+        except ValueError:
+            pass
+    return datetime.now(timezone.utc)
+
+
+# Compiled asset matchers keyed by (tickers, aliases), shared across aggregators
+_asset_matchers: dict[tuple[frozenset, frozenset], tuple[re.Pattern, dict[str, str]]] = {}
+
+
 def _hash_url(url: str) -> str:
-    """Generate a unique ID from URL."""
+    """
+    Generate a unique ID from URL.
+
+    Stored news IDs are this exact digest, so changing the hash would make
+    every article already in the database look new again (and re-alert).
+    """
     return hashlib.sha256(url.encode()).hexdigest()[:16]
 
 
@@ -136,8 +200,12 @@ class NewsAggregator:
         self.cryptopanic_api_key = cryptopanic_api_key
         self.filter_by_assets = filter_by_assets
         self.twitter_enabled = twitter_enabled
-        self._session = _get_http_session()
-        self._seen_urls: set[str] = set()
+        self._session = _http_session
+        # Copy-on-write: readers use whatever snapshot they hold without
+        # locking; writers rebuild and rebind under _seen_lock
+        self._seen_urls: OrderedDict[str, None] = OrderedDict()
+        self._seen_lock = threading.Lock()
+        self._build_asset_pattern()
 
         # Initialize Twitter aggregator if enabled
         self._twitter_aggregator = None
@@ -153,35 +221,43 @@ class NewsAggregator:
 
     def _normalize_asset(self, asset: str) -> Optional[str]:
         """Normalize asset name to ticker symbol."""
-        asset_upper = asset.upper().strip()
-
-        # Direct match
-        if asset_upper in self.HYPERLIQUID_ASSETS:
-            return asset_upper
+        # Tickers and aliases share one reverse index
+        return self._asset_lookup.get(asset.upper().strip())
 
-        # Alias match
-        if asset_upper in self.ASSET_ALIASES:
-            return self.ASSET_ALIASES[asset_upper]
-
-        return None
-
-    def _extract_assets_from_text(self, text: str) -> list[str]:
-        """Extract mentioned assets from title/text."""
-        assets = set()
-        text_upper = text.upper()
-
-        # Check for direct ticker mentions
-        for asset in self.HYPERLIQUID_ASSETS:
-            # Look for word boundaries to avoid false positives
-            if f" {asset} " in f" {text_upper} " or f"${asset}" in text_upper:
-                assets.add(asset)
-
-        # Check for full name mentions
-        for name, ticker in self.ASSET_ALIASES.items():
-            if name in text_upper:
-                assets.add(ticker)
+    def _build_asset_pattern(self) -> None:
+        """
+        Compile one regex matching every ticker and alias.
 
-        return list(assets)
+        Tickers match as whitespace-delimited words or with a $ prefix;
+        full names match anywhere. Longer names come first in each
+        alternation so e.g. "$SUSHI" is not cut short by a shorter ticker.
+        Matchers are shared by every aggregator with the same asset lists.
+        """
+        key = (frozenset(self.HYPERLIQUID_ASSETS), frozenset(self.ASSET_ALIASES.items()))
+        matcher = _asset_matchers.get(key)
+        if matcher is None:
+            tickers = "|".join(map(re.escape, sorted(self.HYPERLIQUID_ASSETS, key=len, reverse=True)))
+            aliases = "|".join(map(re.escape, sorted(self.ASSET_ALIASES, key=len, reverse=True)))
+            pattern = re.compile(
+                rf"\$(?:{tickers})|(?<!\S)(?:{tickers})(?!\S)|{aliases}"
+            )
+            # Reverse index {ticker or alias: ticker}; a direct ticker wins
+            lookup = dict(self.ASSET_ALIASES)
+            lookup.update((asset, asset) for asset in self.HYPERLIQUID_ASSETS)
+            matcher = _asset_matchers[key] = (pattern, lookup)
+        self._asset_pattern, self._asset_lookup = matcher
+
+    def _extract_assets_from_text(self, text: str) -> set[str]:
+        """Extract mentioned assets from title/text in a single regex scan."""
+        # One upper() then a case-sensitive scan is ~3x faster than re.IGNORECASE
+        lookup = self._asset_lookup
+        assets: set[str] = set()
+        for match in self._asset_pattern.finditer(text.upper()):
+            assets.add(lookup[match.group().lstrip("$")])
+            # Stop scanning listicle-style headlines ("Top 10 altcoins ...")
+            if len(assets) >= MAX_ASSETS_PER_ITEM:
+                break
+        return assets
 
     def fetch_cryptopanic(self, limit: int = 50) -> list[NewsItem]:
         """
@@ -208,36 +284,28 @@ class NewsAggregator:
         try:
             response = self._session.get(url, params=params, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
-            data = response.json()
-        except requests.RequestException as e:
+            data = orjson.loads(response.content)
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
             logger.error("CryptoPanic API error: %s", e)
             return []
 
         items = []
         for post in data.get("results", [])[:limit]:
             try:
-                # Extract currencies from the API response
-                currencies = []
+                # Extract assets from the title, plus the API's currency tags
+                title = post.get("title", "")
+                currencies = self._extract_assets_from_text(title)
                 for currency in post.get("currencies", []):
                     code = currency.get("code", "").upper()
                     if code in self.HYPERLIQUID_ASSETS:
-                        currencies.append(code)
-
-                # Also extract from title
-                title = post.get("title", "")
-                title_assets = self._extract_assets_from_text(title)
-                currencies = list(set(currencies + title_assets))
+                        currencies.add(code)
 
                 # Skip if no relevant assets and filtering is enabled
                 if self.filter_by_assets and not currencies:
                     continue
 
                 # Parse timestamp
-                published_str = post.get("published_at", "")
-                try:
-                    published_at = datetime.fromisoformat(published_str.replace("Z", "+00:00"))
-                except ValueError:
-                    published_at = datetime.now(timezone.utc)
+                published_at = _parse_iso_timestamp(post.get("published_at", ""))
 
                 # Get source sentiment votes
                 votes = post.get("votes", {})
@@ -256,7 +324,7 @@ class NewsAggregator:
                     source=NewsSource.CRYPTOPANIC,
                     source_name=post.get("source", {}).get("title", "Unknown"),
                     published_at=published_at,
-                    currencies=currencies,
+                    currencies=list(currencies),
                     raw_sentiment=raw_sentiment
                 )
                 items.append(item)
@@ -288,8 +356,8 @@ class NewsAggregator:
         try:
             response = self._session.get(url, params=params, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
-            data = response.json()
-        except requests.RequestException as e:
+            data = orjson.loads(response.content)
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
             logger.error("CryptoNews API error: %s", e)
             return []
 
@@ -302,17 +370,13 @@ class NewsAggregator:
             try:
                 title = article.get("title", "")
 
-                # Extract assets from categories and title
-                currencies = []
+                # Extract assets from title and categories
+                currencies = self._extract_assets_from_text(title)
                 categories = article.get("categories", "").upper().split("|")
                 for cat in categories:
                     cat = cat.strip()
                     if cat in self.HYPERLIQUID_ASSETS:
-                        currencies.append(cat)
-
-                # Also extract from title
-                title_assets = self._extract_assets_from_text(title)
-                currencies = list(set(currencies + title_assets))
+                        currencies.add(cat)
 
                 # Skip if no relevant assets and filtering is enabled
                 if self.filter_by_assets and not currencies:
@@ -330,7 +394,7 @@ class NewsAggregator:
                     source=NewsSource.CRYPTONEWS,
                     source_name=article.get("source_info", {}).get("name", article.get("source", "Unknown")),
                     published_at=published_at,
-                    currencies=currencies,
+                    currencies=list(currencies),
                     raw_sentiment=None  # This API doesn't provide sentiment
                 )
                 items.append(item)
@@ -375,7 +439,7 @@ class NewsAggregator:
                     source=NewsSource.CRYPTONEWS,  # Reuse existing source type
                     source_name=f"@{tweet.username}",
                     published_at=tweet.published_at,
-                    currencies=currencies,
+                    currencies=list(currencies),
                     raw_sentiment=None
                 )
                 items.append(item)
@@ -396,27 +460,24 @@ class NewsAggregator:
         Returns:
             Deduplicated list of NewsItem objects, sorted by published_at desc
         """
-        all_items: list[NewsItem] = []
-
-        # Fetch from all sources
-        all_items.extend(self.fetch_cryptopanic(limit=limit_per_source))
-        all_items.extend(self.fetch_cryptonews(limit=limit_per_source))
-        all_items.extend(self.fetch_twitter(limit=limit_per_source))
-
-        # Deduplicate by URL hash
-        seen_ids: set[str] = set()
-        unique_items: list[NewsItem] = []
-
-        for item in all_items:
-            if item.id not in seen_ids and item.id not in self._seen_urls:
-                seen_ids.add(item.id)
-                unique_items.append(item)
+        # Deduplicated by URL hash as results arrive; first occurrence wins
+        unique: dict[str, NewsItem] = {}
+        seen_before = self._seen_urls
+
+        # Fetch from all sources concurrently; results are merged in source
+        # order so deduplication keeps the same item as a serial fetch would
+        sources = (self.fetch_cryptopanic, self.fetch_cryptonews, self.fetch_twitter)
+        futures = [_fetch_executor.submit(fetch, limit=limit_per_source) for fetch in sources]
+        for future in futures:
+            for item in future.result():
+                if item.id not in unique and item.id not in seen_before:
+                    unique[item.id] = item
 
         # Update seen URLs for future deduplication
-        self._seen_urls.update(seen_ids)
+        self.mark_seen(unique.keys())
 
         # Sort by published time (newest first)
-        unique_items.sort(key=lambda x: x.published_at, reverse=True)
+        unique_items = sorted(unique.values(), key=attrgetter("published_at"), reverse=True)
 
         logger.info("Aggregated %d unique news items", len(unique_items))
         return unique_items
@@ -433,9 +494,22 @@ class NewsAggregator:
         """
         return self.fetch_all(limit_per_source=limit_per_source)
 
+    def mark_seen(self, news_ids: Iterable[str]) -> None:
+        """
+        Add IDs to the seen window without fetching, e.g. to warm it on startup.
+
+        Args:
+            news_ids: News IDs already handled elsewhere
+        """
+        with self._seen_lock:
+            seen = OrderedDict(self._seen_urls)
+            _remember_seen(seen, news_ids)
+            self._seen_urls = seen
+
     def clear_seen(self) -> None:
         """Clear the seen URLs cache."""
-        self._seen_urls.clear()
+        with self._seen_lock:
+            self._seen_urls = OrderedDict()
         logger.info("Cleared seen URLs cache")
 
     def add_asset(self, asset: str) -> bool:
@@ -452,6 +526,7 @@ class NewsAggregator:
         if asset_upper in self.HYPERLIQUID_ASSETS:
             return False
         self.HYPERLIQUID_ASSETS.add(asset_upper)
+        self._build_asset_pattern()
         return True
 
     def remove_asset(self, asset: str) -> bool:
@@ -468,4 +543,5 @@ class NewsAggregator:
         if asset_upper not in self.HYPERLIQUID_ASSETS:
             return False
         self.HYPERLIQUID_ASSETS.discard(asset_upper)
+        self._build_asset_pattern()
         return True
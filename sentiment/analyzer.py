@@ -3,19 +3,27 @@
 Analyzes news headlines and returns structured sentiment signals.
 """
 
+import hashlib
 import json
 import logging
+import re
+import sys
+import threading
 import time
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Optional
 
+import orjson
 import requests
 from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
 from urllib3.util.retry import Retry
 
-from .aggregator import NewsItem
+from .aggregator import NewsItem, _parse_iso_timestamp
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +36,21 @@ RETRY_BACKOFF = 0.5
 
 # Rate limiting
 MIN_REQUEST_INTERVAL = 0.1  # 100ms between requests
-MAX_BATCH_SIZE = 10  # Max items per batch analysis
+RATE_LIMIT_KINDS = ("requests", "tokens")  # anthropic-ratelimit-<kind>-remaining/-reset headers
+MAX_BATCH_SIZE = 25  # Max items per batch analysis
+MAX_CONCURRENT_BATCHES = 4  # Batch requests in flight at once
+
+# Output token budget for Claude responses
+DEFAULT_MAX_TOKENS = 1024  # Single items and small batches
+BATCH_TOKENS_PER_ITEM = 150  # Per headline in a batch (JSON object + reasoning)
+MAX_OUTPUT_TOKENS = 8192
+
+# Input budget for the headlines in one batch, estimated without a tokenizer
+MAX_BATCH_INPUT_TOKENS = 8000
+CHARS_PER_TOKEN = 4  # Conservative average for English headlines
+
+# Analyses remembered by headline, so reposted news isn't re-sent to Claude
+RESULT_CACHE_SIZE = 10_000
 
 
 class SentimentScore(str, Enum):
@@ -48,9 +70,76 @@ class SignalStrength(str, Enum):
     NONE = "none"
 
 
-@dataclass
+# Optional ```json ... ``` fence Claude sometimes wraps JSON in
+_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*(.*?)\s*(?:```|\Z)", re.DOTALL)
+
+# Headlines matching none of these are treated as neutral without an API
+# call when the prefilter is on. Kept deliberately broad (events, price
+# action, macro): a miss here silently drops a signal, while a false hit only
+# costs one analysis. Stems match any word they start; short or ambiguous
+# words are listed with their inflections so "ban" can't match "bank".
+_SIGNAL_STEMS = (
+    "regulat", "inflation", "tariff", "stablecoin", "treasur", "reserve",
+    "hack", "exploit", "breach", "theft", "outage", "bankrupt", "insolven", "lawsuit",
+    "indict", "settle", "approv", "reject", "delist", "partner", "acqui", "merger",
+    "integrat", "adopt", "upgrade", "mainnet", "launch", "airdrop", "unlock", "halving",
+    "surg", "soar", "rall", "jump", "spike", "pump", "crash", "plung", "plummet",
+    "tumbl", "slump", "sink", "drop", "dump", "rise", "rising", "fall", "gain",
+    "climb", "rebound", "recover", "skyrocket", "bull", "bear", "momentum",
+    "record", "liquidat", "whale", "inflow", "outflow", "suspend", "filing",
+)
+_SIGNAL_WORDS = (
+    "SEC", "CFTC", "DOJ", "ETFs?", "Fed", "Federal Reserve", "FOMC", "CPI", "ATH",
+    "all-time highs?", "rate (?:cut|hike)s?", "sue[sd]", "suing", "ban(?:s|ned|ning)?",
+    "charge[sd]?", "den(?:y|ies|ied)", "drain(?:s|ed)?", "st(?:eal|ole|olen)",
+    "scams?", "rug ?pull(?:s|ed)?", "halt(?:s|ed)?", "freez(?:e|es|ing)", "froze(?:n)?",
+    "list(?:s|ed|ing|ings)?", "fork(?:s|ed)?", "burn(?:s|ed|ing)?", "mint(?:s|ed|ing)?",
+    "file[sd]?", "rose", "fell", "sank", "slid(?:e|es|ing)?", "break(?:s|ing|out|down)?",
+    "broke", "hits?", "tops?|topped", "buy(?:s|ing)?", "bought", "sells?|selling|sold",
+)
+_SIGNAL_KEYWORDS_RE = re.compile(
+    r"\b(?:" + "|".join(_SIGNAL_STEMS) + r")"
+    r"|\b(?:" + "|".join(_SIGNAL_WORDS) + r")\b"
+    r"|\d%",
+    re.IGNORECASE
+)
+
+# Map string values to enums (handle variations Claude might return)
+_SENTIMENT_MAP = {
+    "very_bullish": SentimentScore.VERY_BULLISH,
+    "bullish": SentimentScore.BULLISH,
+    "positive": SentimentScore.BULLISH,  # alias
+    "neutral": SentimentScore.NEUTRAL,
+    "mixed": SentimentScore.NEUTRAL,  # alias
+    "bearish": SentimentScore.BEARISH,
+    "negative": SentimentScore.BEARISH,  # alias
+    "very_bearish": SentimentScore.VERY_BEARISH
+}
+
+_STRENGTH_MAP = {
+    "strong": SignalStrength.STRONG,
+    "high": SignalStrength.STRONG,  # alias
+    "4": SignalStrength.STRONG,
+    "5": SignalStrength.STRONG,
+    "moderate": SignalStrength.MODERATE,
+    "medium": SignalStrength.MODERATE,  # alias
+    "3": SignalStrength.MODERATE,
+    "weak": SignalStrength.WEAK,
+    "low": SignalStrength.WEAK,  # alias
+    "1": SignalStrength.WEAK,
+    "2": SignalStrength.WEAK,
+    "none": SignalStrength.NONE,
+    "0": SignalStrength.NONE
+}
+
+
+# Signal strengths that can make a result actionable
+_ACTIONABLE_STRENGTHS = frozenset({SignalStrength.STRONG, SignalStrength.MODERATE})
+
+
+@dataclass(slots=True)
 class SentimentResult:
-    """Result of sentiment analysis for a news item."""
+    """Result of sentiment analysis for a news item (slotted: one per headline)."""
     news_id: str                     # Reference to NewsItem.id
     title: str                       # Original headline
     sentiment: SentimentScore        # Classified sentiment
@@ -61,6 +150,15 @@ class SentimentResult:
     price_impact: str                # "up", "down", "neutral"
     timeframe: str                   # "immediate", "short_term", "long_term"
     analyzed_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    is_actionable: bool = field(init=False)  # Worth alerting on; set once in __post_init__
+
+    def __post_init__(self) -> None:
+        """Decide once whether this signal is worth alerting on."""
+        self.is_actionable = (
+            self.signal_strength in _ACTIONABLE_STRENGTHS
+            and self.confidence >= 0.6
+            and self.sentiment is not SentimentScore.NEUTRAL
+        )
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
@@ -77,19 +175,58 @@ class SentimentResult:
             "analyzed_at": self.analyzed_at.isoformat()
         }
 
-    @property
-    def is_actionable(self) -> bool:
-        """Check if this signal is worth alerting on."""
-        return (
-            self.signal_strength in (SignalStrength.STRONG, SignalStrength.MODERATE)
-            and self.confidence >= 0.6
-            and self.sentiment != SentimentScore.NEUTRAL
-        )
+
+def _strip_fence(response: str) -> str:
+    """Strip a markdown code fence from a Claude response, if present."""
+    match = _FENCE_RE.match(response)
+    return match.group(1) if match else response.strip()
+
+
+def _salvage_json_array(text: str) -> list:
+    """
+    Recover the complete leading elements of a malformed JSON array.
+
+    Args:
+        text: Response text expected to hold a JSON array
+
+    Returns:
+        Elements decoded before the first unparseable point (may be empty)
+    """
+    decoder = json.JSONDecoder()
+    items = []
+    pos = text.find("[") + 1
+    if not pos:
+        return items
+
+    while True:
+        # Skip separators between elements
+        while pos < len(text) and text[pos] in " \t\r\n,":
+            pos += 1
+        if pos >= len(text) or text[pos] == "]":
+            return items
+        try:
+            item, pos = decoder.raw_decode(text, pos)
+        except ValueError:
+            return items
+        items.append(item)
+
+
+def _intern(value):
+    """Intern small-vocabulary strings so long-lived results share one copy."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _has_signal_keywords(title: str) -> bool:
+    """Check whether a headline could plausibly move prices."""
+    return _SIGNAL_KEYWORDS_RE.search(title) is not None
 
 
 def _get_http_session() -> requests.Session:
     """Create a requests session with retry logic."""
     session = requests.Session()
+    # Advertise every encoding urllib3 can decode here: gzip always, plus
+    # br/zstd when the brotli/zstandard packages are installed
+    session.headers.update(make_headers(accept_encoding=True))
     retry_strategy = Retry(
         total=MAX_RETRIES,
         backoff_factor=RETRY_BACKOFF,
@@ -101,6 +238,30 @@ def _get_http_session() -> requests.Session:
     return session
 
 
+# Shared by every analyzer instance so the keep-alive connection to the API
+# survives across polls and the per-request analyzers in the debug endpoint
+_http_session = _get_http_session()
+
+# Shared worker threads for concurrent batch requests
+_batch_executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_BATCHES, thread_name_prefix="claude-batch")
+
+# Set once the first analyzer has started warming the API connection
+_connection_warmed = threading.Event()
+
+
+# LRU of analysis results keyed by SentimentAnalyzer._cache_key
+_result_cache: OrderedDict[str, "SentimentResult"] = OrderedDict()
+_result_cache_lock = threading.Lock()
+
+
+def _warm_connection() -> None:
+    """Open the TLS connection to the API ahead of the first real request."""
+    try:
+        _http_session.head(ANTHROPIC_API_URL, timeout=REQUEST_TIMEOUT)
+    except requests.RequestException as e:
+        logger.debug("Claude API connection warm-up failed: %s", e)
+
+
 class SentimentAnalyzer:
     """Analyzes crypto news sentiment using Claude Haiku."""
 
@@ -126,33 +287,124 @@ Consider:
 Be conservative with "strong" signals - only major events warrant them.
 Return valid JSON only, no markdown."""
 
-    def __init__(self, api_key: str):
+    # Fixed tail of every batch prompt, after the numbered headlines
+    BATCH_PROMPT_SUFFIX = """
+
+Return a JSON array with one object per headline, each containing:
+sentiment, confidence, signal_strength, price_impact, timeframe, reasoning
+
+Example format:
+[
+  {"sentiment": "bullish", "confidence": 0.8, "signal_strength": "moderate", "price_impact": "up", "timeframe": "short_term", "reasoning": "..."},
+  ...
+]"""
+
+    def __init__(self, api_key: str, prefilter: bool = False):
         """
         Initialize the sentiment analyzer.
 
         Args:
             api_key: Anthropic API key
+            prefilter: Skip the API for batch headlines with no market-moving
+                keywords (off by default; a missed keyword drops the signal)
         """
         if not api_key:
             raise ValueError("Anthropic API key is required")
 
         self.api_key = api_key
-        self._session = _get_http_session()
+        self.prefilter = prefilter
+        self._session = _http_session
         self._last_request_time = 0.0
+        self._rate_lock = threading.Lock()
+
+        # Pay the TCP/TLS handshake in the background, once per process
+        if not _connection_warmed.is_set():
+            _connection_warmed.set()
+            _batch_executor.submit(_warm_connection)
+
+    def _cache_key(self, news_item: NewsItem) -> str:
+        """Hash everything that determines Claude's answer for a headline."""
+        key_parts = [ANTHROPIC_MODEL, self.SYSTEM_PROMPT, news_item.title, sorted(news_item.currencies or [])]
+        return hashlib.sha256(orjson.dumps(key_parts)).hexdigest()
+
+    def _get_cached(self, news_item: NewsItem) -> Optional[SentimentResult]:
+        """
+        Look up a previous analysis of the same headline.
+
+        Args:
+            news_item: NewsItem about to be analyzed
+
+        Returns:
+            The cached analysis re-targeted at news_item, or None on a miss
+        """
+        key = self._cache_key(news_item)
+        with _result_cache_lock:
+            cached = _result_cache.get(key)
+            if cached is None:
+                return None
+            _result_cache.move_to_end(key)
+
+        return replace(
+            cached,
+            news_id=news_item.id,
+            title=news_item.title,
+            assets=news_item.currencies or cached.assets,
+            analyzed_at=datetime.now(timezone.utc)
+        )
+
+    def _set_cached(self, news_item: NewsItem, result: SentimentResult) -> None:
+        """Remember an analysis, evicting the least recently used beyond RESULT_CACHE_SIZE."""
+        key = self._cache_key(news_item)
+        with _result_cache_lock:
+            _result_cache[key] = result
+            _result_cache.move_to_end(key)
+            while len(_result_cache) > RESULT_CACHE_SIZE:
+                _result_cache.popitem(last=False)
 
     def _rate_limit(self) -> None:
-        """Enforce minimum interval between requests."""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < MIN_REQUEST_INTERVAL:
-            time.sleep(MIN_REQUEST_INTERVAL - elapsed)
-        self._last_request_time = time.time()
+        """Enforce minimum interval between requests, across threads."""
+        # Reserve the next send slot under the lock, then sleep outside it
+        with self._rate_lock:
+            now = time.monotonic()
+            send_at = max(now, self._last_request_time + MIN_REQUEST_INTERVAL)
+            self._last_request_time = send_at
+        if send_at > now:
+            time.sleep(send_at - now)
+
+    def _respect_rate_limit_headers(self, headers) -> None:
+        """
+        Hold back further requests when the API reports an exhausted quota.
 
-    def _call_claude(self, prompt: str) -> Optional[str]:
+        Args:
+            headers: Response headers from the Claude API
+        """
+        wait = 0.0
+        for kind in RATE_LIMIT_KINDS:
+            remaining = headers.get(f"anthropic-ratelimit-{kind}-remaining")
+            reset = headers.get(f"anthropic-ratelimit-{kind}-reset")
+            if remaining is None or reset is None or remaining != "0":
+                continue
+            # Handles the API's trailing "Z" on any Python version; a malformed
+            # value parses as now, i.e. no pause
+            reset_at = _parse_iso_timestamp(reset)
+            if reset_at.tzinfo is None:
+                reset_at = reset_at.replace(tzinfo=timezone.utc)
+            wait = max(wait, (reset_at - datetime.now(timezone.utc)).total_seconds())
+
+        if wait > 0:
+            logger.info("Claude API quota exhausted, pausing requests for %.1fs", wait)
+            # Push the next send slot out to the reset time
+            with self._rate_lock:
+                resume_at = time.monotonic() + wait - MIN_REQUEST_INTERVAL
+                self._last_request_time = max(self._last_request_time, resume_at)
+
+    def _call_claude(self, prompt: str, max_tokens: int = DEFAULT_MAX_TOKENS) -> Optional[str]:
         """
         Make a request to Claude API.
 
         Args:
             prompt: The user prompt
+            max_tokens: Output token budget for the response
 
         Returns:
             Response text or None on error
@@ -167,7 +419,7 @@ Return valid JSON only, no markdown."""
 
         payload = {
             "model": ANTHROPIC_MODEL,
-            "max_tokens": 1024,
+            "max_tokens": max_tokens,
             "system": self.SYSTEM_PROMPT,
             "messages": [
                 {"role": "user", "content": prompt}
@@ -178,11 +430,12 @@ Return valid JSON only, no markdown."""
             response = self._session.post(
                 ANTHROPIC_API_URL,
                 headers=headers,
-                json=payload,
+                data=orjson.dumps(payload),
                 timeout=REQUEST_TIMEOUT
             )
+            self._respect_rate_limit_headers(response.headers)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             # Extract text from response
             content = data.get("content", [])
@@ -191,10 +444,36 @@ Return valid JSON only, no markdown."""
 
             return None
 
-        except requests.RequestException as e:
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
             logger.error("Claude API error: %s", e)
             return None
 
+    def _build_result(self, data: dict, news_item: NewsItem) -> SentimentResult:
+        """
+        Build a SentimentResult from one parsed analysis object.
+
+        Args:
+            data: Analysis fields returned by Claude for one headline
+            news_item: News item the analysis belongs to
+
+        Returns:
+            SentimentResult for news_item
+        """
+        raw_sentiment = str(data.get("sentiment", "neutral")).lower()
+        raw_strength = str(data.get("signal_strength", "none")).lower()
+
+        return SentimentResult(
+            news_id=news_item.id,
+            title=news_item.title,
+            sentiment=_SENTIMENT_MAP.get(raw_sentiment, SentimentScore.NEUTRAL),
+            confidence=float(data.get("confidence", 0.5)),
+            signal_strength=_STRENGTH_MAP.get(raw_strength, SignalStrength.NONE),
+            assets=[_intern(asset) for asset in news_item.currencies or data.get("assets", [])],
+            reasoning=data.get("reasoning", "No reasoning provided"),
+            price_impact=_intern(data.get("price_impact", "neutral")),
+            timeframe=_intern(data.get("timeframe", "short_term"))
+        )
+
     def _parse_sentiment_response(self, response: str, news_item: NewsItem) -> Optional[SentimentResult]:
         """
         Parse Claude's JSON response into a SentimentResult.
@@ -208,61 +487,10 @@ Return valid JSON only, no markdown."""
         """
         try:
             # Clean up response (remove markdown if present)
-            response = response.strip()
-            if response.startswith("```"):
-                response = response.split("```")[1]
-                if response.startswith("json"):
-                    response = response[4:]
-            response = response.strip()
-
-            data = json.loads(response)
-
-            # Map string values to enums (handle variations Claude might return)
-            sentiment_map = {
-                "very_bullish": SentimentScore.VERY_BULLISH,
-                "bullish": SentimentScore.BULLISH,
-                "positive": SentimentScore.BULLISH,  # alias
-                "neutral": SentimentScore.NEUTRAL,
-                "mixed": SentimentScore.NEUTRAL,  # alias
-                "bearish": SentimentScore.BEARISH,
-                "negative": SentimentScore.BEARISH,  # alias
-                "very_bearish": SentimentScore.VERY_BEARISH
-            }
-
-            strength_map = {
-                "strong": SignalStrength.STRONG,
-                "high": SignalStrength.STRONG,  # alias
-                "4": SignalStrength.STRONG,
-                "5": SignalStrength.STRONG,
-                "moderate": SignalStrength.MODERATE,
-                "medium": SignalStrength.MODERATE,  # alias
-                "3": SignalStrength.MODERATE,
-                "weak": SignalStrength.WEAK,
-                "low": SignalStrength.WEAK,  # alias
-                "1": SignalStrength.WEAK,
-                "2": SignalStrength.WEAK,
-                "none": SignalStrength.NONE,
-                "0": SignalStrength.NONE
-            }
-
-            raw_sentiment = str(data.get("sentiment", "neutral")).lower()
-            raw_strength = str(data.get("signal_strength", "none")).lower()
-            sentiment = sentiment_map.get(raw_sentiment, SentimentScore.NEUTRAL)
-            signal_strength = strength_map.get(raw_strength, SignalStrength.NONE)
-
-            return SentimentResult(
-                news_id=news_item.id,
-                title=news_item.title,
-                sentiment=sentiment,
-                confidence=float(data.get("confidence", 0.5)),
-                signal_strength=signal_strength,
-                assets=news_item.currencies or data.get("assets", []),
-                reasoning=data.get("reasoning", "No reasoning provided"),
-                price_impact=data.get("price_impact", "neutral"),
-                timeframe=data.get("timeframe", "short_term")
-            )
+            data = orjson.loads(_strip_fence(response))
+            return self._build_result(data, news_item)
 
-        except (json.JSONDecodeError, KeyError, TypeError) as e:
+        except (orjson.JSONDecodeError, KeyError, TypeError) as e:
             logger.warning("Failed to parse sentiment response: %s", e)
             return None
 
@@ -276,6 +504,10 @@ Return valid JSON only, no markdown."""
         Returns:
             SentimentResult or None on error
         """
+        cached = self._get_cached(news_item)
+        if cached:
+            return cached
+
         prompt = f"""Analyze this crypto news headline:
 
 Title: {news_item.title}
@@ -289,108 +521,159 @@ Return JSON with: sentiment, confidence, signal_strength, price_impact, timefram
         if not response:
             return None
 
-        return self._parse_sentiment_response(response, news_item)
+        result = self._parse_sentiment_response(response, news_item)
+        if result:
+            self._set_cached(news_item, result)
+        return result
+
+    def _neutral_result(self, news_item: NewsItem) -> SentimentResult:
+        """Build the no-signal result for a headline skipped by the prefilter."""
+        return SentimentResult(
+            news_id=news_item.id,
+            title=news_item.title,
+            sentiment=SentimentScore.NEUTRAL,
+            confidence=0.0,
+            signal_strength=SignalStrength.NONE,
+            assets=news_item.currencies,
+            reasoning="Skipped: no market-moving keywords in headline",
+            price_impact="neutral",
+            timeframe="short_term"
+        )
 
-    def analyze_batch(self, news_items: list[NewsItem]) -> list[SentimentResult]:
+    def _analyze_chunk(self, batch: list[NewsItem]) -> list[SentimentResult]:
         """
-        Analyze multiple news items efficiently.
+        Analyze up to MAX_BATCH_SIZE news items in one request.
 
         Args:
-            news_items: List of NewsItem objects
+            batch: NewsItem objects to analyze together
 
         Returns:
             List of SentimentResult objects (may be shorter than input on errors)
         """
-        if not news_items:
-            return []
-
         results: list[SentimentResult] = []
 
-        # Process in batches
-        for i in range(0, len(news_items), MAX_BATCH_SIZE):
-            batch = news_items[i:i + MAX_BATCH_SIZE]
+        # Build batch prompt; only the count and headlines vary per request
+        headlines = "\n".join([
+            f"{idx}. [{', '.join(item.currencies) or 'CRYPTO'}] {item.title}"
+            for idx, item in enumerate(batch, 1)
+        ])
+        prompt = (
+            f"Analyze these {len(batch)} crypto news headlines for market sentiment.\n\n"
+            f"Headlines:\n{headlines}{self.BATCH_PROMPT_SUFFIX}"
+        )
 
-            # Build batch prompt
-            headlines = []
-            for idx, item in enumerate(batch):
-                headlines.append(
-                    f"{idx + 1}. [{', '.join(item.currencies) or 'CRYPTO'}] {item.title}"
-                )
+        max_tokens = min(MAX_OUTPUT_TOKENS, max(DEFAULT_MAX_TOKENS, BATCH_TOKENS_PER_ITEM * len(batch)))
+        response = self._call_claude(prompt, max_tokens=max_tokens)
+        if not response:
+            # Fall back to individual analysis
+            logger.warning("Batch analysis failed, falling back to individual")
+            for item in batch:
+                result = self.analyze_single(item)
+                if result:
+                    results.append(result)
+            return results
+
+        # Parse batch response
+        text = _strip_fence(response)
+        fall_back = False
+        try:
+            parsed = orjson.loads(text)
+        except orjson.JSONDecodeError as e:
+            # Keep the complete objects of a truncated or trailing-garbage
+            # array; only the headlines after them are re-asked one by one
+            parsed = _salvage_json_array(text)
+            fall_back = True
+            logger.warning("Failed to parse batch response (%s), salvaged %d/%d items", e, len(parsed), len(batch))
 
-            prompt = f"""Analyze these {len(batch)} crypto news headlines for market sentiment.
+        try:
+            if isinstance(parsed, list):
+                # Pair each parsed object with its batch item; build them all
+                # before keeping any so a bad entry can't duplicate the fallback
+                results.extend([
+                    self._build_result(data, item)
+                    for item, data in zip(batch, parsed)
+                ])
+        except (AttributeError, TypeError) as e:
+            logger.warning("Failed to parse batch response: %s", e)
+            fall_back = True
+
+        if fall_back:
+            # Fall back to individual
+            for item in batch[len(results):]:
+                result = self.analyze_single(item)
+                if result:
+                    results.append(result)
 
-Headlines:
-{chr(10).join(headlines)}
+        return results
 
-Return a JSON array with one object per headline, each containing:
-sentiment, confidence, signal_strength, price_impact, timeframe, reasoning
+    def _pack_batches(self, news_items: list[NewsItem]) -> list[list[NewsItem]]:
+        """
+        Split news items into batches bounded by count and estimated input tokens.
 
-Example format:
-[
-  {{"sentiment": "bullish", "confidence": 0.8, "signal_strength": "moderate", "price_impact": "up", "timeframe": "short_term", "reasoning": "..."}},
-  ...
-]"""
+        Args:
+            news_items: NewsItem objects to send for analysis
 
-            response = self._call_claude(prompt)
-            if not response:
-                # Fall back to individual analysis
-                logger.warning("Batch analysis failed, falling back to individual")
-                for item in batch:
-                    result = self.analyze_single(item)
-                    if result:
-                        results.append(result)
-                continue
+        Returns:
+            Batches of at most MAX_BATCH_SIZE items and about MAX_BATCH_INPUT_TOKENS
+        """
+        batches: list[list[NewsItem]] = []
+        batch: list[NewsItem] = []
+        batch_tokens = 0
+        for item in news_items:
+            # Headline plus its "N. [ASSETS] " prefix
+            tokens = (len(item.title) + 8 + 5 * len(item.currencies)) // CHARS_PER_TOKEN + 1
+            if batch and (len(batch) >= MAX_BATCH_SIZE or batch_tokens + tokens > MAX_BATCH_INPUT_TOKENS):
+                batches.append(batch)
+                batch, batch_tokens = [], 0
+            batch.append(item)
+            batch_tokens += tokens
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def analyze_batch(self, news_items: list[NewsItem]) -> list[SentimentResult]:
+        """
+        Analyze multiple news items efficiently.
+
+        Headlines without market-moving keywords get a neutral result when
+        prefilter is on, and headlines analyzed before are served from the
+        result cache; the rest go out in batches of MAX_BATCH_SIZE, sent concurrently (up to
+        MAX_CONCURRENT_BATCHES at once). Results keep the input order.
+
+        Args:
+            news_items: List of NewsItem objects
 
-            # Parse batch response
-            try:
-                response = response.strip()
-                if response.startswith("```"):
-                    response = response.split("```")[1]
-                    if response.startswith("json"):
-                        response = response[4:]
-                response = response.strip()
-
-                parsed = json.loads(response)
-
-                if isinstance(parsed, list):
-                    for idx, data in enumerate(parsed):
-                        if idx < len(batch):
-                            # Create result using batch item and parsed data
-                            item = batch[idx]
-                            sentiment_map = {
-                                "very_bullish": SentimentScore.VERY_BULLISH,
-                                "bullish": SentimentScore.BULLISH,
-                                "neutral": SentimentScore.NEUTRAL,
-                                "bearish": SentimentScore.BEARISH,
-                                "very_bearish": SentimentScore.VERY_BEARISH
-                            }
-                            strength_map = {
-                                "strong": SignalStrength.STRONG,
-                                "moderate": SignalStrength.MODERATE,
-                                "weak": SignalStrength.WEAK,
-                                "none": SignalStrength.NONE
-                            }
-
-                            result = SentimentResult(
-                                news_id=item.id,
-                                title=item.title,
-                                sentiment=sentiment_map.get(data.get("sentiment", "neutral"), SentimentScore.NEUTRAL),
-                                confidence=float(data.get("confidence", 0.5)),
-                                signal_strength=strength_map.get(data.get("signal_strength", "none"), SignalStrength.NONE),
-                                assets=item.currencies,
-                                reasoning=data.get("reasoning", ""),
-                                price_impact=data.get("price_impact", "neutral"),
-                                timeframe=data.get("timeframe", "short_term")
-                            )
-                            results.append(result)
-
-            except (json.JSONDecodeError, TypeError) as e:
-                logger.warning("Failed to parse batch response: %s", e)
-                # Fall back to individual
-                for item in batch:
-                    result = self.analyze_single(item)
-                    if result:
-                        results.append(result)
+        Returns:
+            List of SentimentResult objects (may be shorter than input on errors)
+        """
+        if not news_items:
+            return []
+
+        by_id: dict[str, SentimentResult] = {}
+        misses: list[NewsItem] = []
+        for item in news_items:
+            if self.prefilter and not _has_signal_keywords(item.title):
+                by_id[item.id] = self._neutral_result(item)
+                continue
+            cached = self._get_cached(item)
+            if cached:
+                by_id[item.id] = cached
+            else:
+                misses.append(item)
+
+        batches = self._pack_batches(misses)
+        items_by_id = {item.id: item for item in misses}
+        for batch_results in _batch_executor.map(self._analyze_chunk, batches):
+            for result in batch_results:
+                by_id[result.news_id] = result
+                self._set_cached(items_by_id[result.news_id], result)
+
+        results = [by_id[item.id] for item in news_items if item.id in by_id]
+        if len(misses) < len(news_items):
+            logger.info(
+                "Skipped the API for %d/%d news items (prefilter or result cache)",
+                len(news_items) - len(misses), len(news_items)
+            )
 
         logger.info("Analyzed %d/%d news items", len(results), len(news_items))
         return results
@@ -412,6 +695,26 @@ Example format:
         return actionable
 
 
+# Display forms built once at import (e.g. VERY_BULLISH -> "VERY BULLISH")
+SENTIMENT_LABELS = {score: score.value.upper().replace("_", " ") for score in SentimentScore}
+
+# Emoji mapping for plain-text alerts
+_ALERT_SENTIMENT_EMOJI = {
+    SentimentScore.VERY_BULLISH: "🚀🟢",
+    SentimentScore.BULLISH: "🟢",
+    SentimentScore.NEUTRAL: "⚪",
+    SentimentScore.BEARISH: "🔴",
+    SentimentScore.VERY_BEARISH: "🔴💀"
+}
+
+_ALERT_STRENGTH_LABELS = {
+    SignalStrength.STRONG: "⚡ STRONG",
+    SignalStrength.MODERATE: "📊 MODERATE",
+    SignalStrength.WEAK: "📉 WEAK",
+    SignalStrength.NONE: "—"
+}
+
+
 def create_alert_message(result: SentimentResult) -> str:
     """
     Create a formatted alert message for a sentiment result.
@@ -422,28 +725,12 @@ def create_alert_message(result: SentimentResult) -> str:
     Returns:
         Formatted string for alerts
     """
-    # Emoji mapping
-    sentiment_emoji = {
-        SentimentScore.VERY_BULLISH: "🚀🟢",
-        SentimentScore.BULLISH: "🟢",
-        SentimentScore.NEUTRAL: "⚪",
-        SentimentScore.BEARISH: "🔴",
-        SentimentScore.VERY_BEARISH: "🔴💀"
-    }
-
-    strength_label = {
-        SignalStrength.STRONG: "⚡ STRONG",
-        SignalStrength.MODERATE: "📊 MODERATE",
-        SignalStrength.WEAK: "📉 WEAK",
-        SignalStrength.NONE: "—"
-    }
-
-    emoji = sentiment_emoji.get(result.sentiment, "⚪")
-    strength = strength_label.get(result.signal_strength, "—")
+    emoji = _ALERT_SENTIMENT_EMOJI.get(result.sentiment, "⚪")
+    strength = _ALERT_STRENGTH_LABELS.get(result.signal_strength, "—")
     assets_str = ", ".join(result.assets) if result.assets else "CRYPTO"
     confidence_pct = int(result.confidence * 100)
 
-    message = f"""{emoji} **{result.sentiment.value.upper().replace('_', ' ')}** | {strength}
+    message = f"""{emoji} **{SENTIMENT_LABELS[result.sentiment]}** | {strength}
 
 **Assets:** {assets_str}
 **Confidence:** {confidence_pct}%
@@ -4,16 +4,19 @@ Sends formatted alerts to Discord channels via webhooks.
 """
 
 import logging
+import queue
+from itertools import groupby
+import threading
 import time
 from dataclasses import dataclass
-from datetime import datetime, timezone
 from typing import Optional
 
+import orjson
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
-from .analyzer import SentimentResult, SentimentScore, SignalStrength
+from .analyzer import SENTIMENT_LABELS, SentimentResult, SentimentScore, SignalStrength
 
 logger = logging.getLogger(__name__)
 
@@ -23,9 +26,14 @@ MAX_RETRIES = 3
 RETRY_BACKOFF = 1.0
 
 # Rate limiting (Discord allows 30 requests per minute per webhook)
-MIN_REQUEST_INTERVAL = 2.0  # 2 seconds between messages
+RATE_LIMIT_PER_MINUTE = 30  # Sustained token-bucket refill rate
+RATE_LIMIT_BURST = 5  # Bucket capacity (Discord's per-webhook burst is 5 per 2s)
 MAX_EMBEDS_PER_MESSAGE = 10
 
+# Queued embeds waiting for the background sender
+SEND_QUEUE_MAXSIZE = 100
+SENDER_CLOSE_TIMEOUT = 30  # seconds close() waits for queued embeds to go out
+
 # Colors for embeds (decimal format)
 COLORS = {
     SentimentScore.VERY_BULLISH: 0x00FF00,  # Bright green
@@ -51,6 +59,15 @@ STRENGTH_EMOJI = {
     SignalStrength.NONE: "—",
 }
 
+# Display forms built once at import (e.g. MODERATE -> "Moderate")
+STRENGTH_LABELS = {strength: strength.value.title() for strength in SignalStrength}
+
+
+def _iso_now() -> str:
+    """Current UTC time as an ISO-8601 embed timestamp (millisecond precision)."""
+    now = time.time()
+    return f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(now))}.{int(now % 1 * 1000):03d}Z"
+
 
 def _get_http_session() -> requests.Session:
     """Create a requests session with retry logic."""
@@ -66,9 +83,14 @@ def _get_http_session() -> requests.Session:
     return session
 
 
-@dataclass
+# Shared by every webhook client so the keep-alive connection to Discord
+# survives the bot being destroyed and recreated from the API
+_http_session = _get_http_session()
+
+
+@dataclass(slots=True)
 class DiscordEmbed:
-    """Discord embed structure."""
+    """Discord embed structure (slotted; built once per alert)."""
     title: str
     description: str
     color: int
@@ -98,9 +120,46 @@ class DiscordEmbed:
         return embed
 
 
+# Fixed bot status embeds in API format; senders add the timestamp (and
+# the error text) per message
+_STARTUP_EMBED = DiscordEmbed(
+    title="🤖 Sentiment Bot Online",
+    description="Monitoring crypto news for trading signals...",
+    color=0x00BFFF,  # Deep sky blue
+    fields=[
+        {
+            "name": "Features",
+            "value": "• Real-time news monitoring\n• AI sentiment analysis\n• Actionable trading signals",
+            "inline": False
+        }
+    ],
+    footer="Hyperliquid Trade Journal"
+).to_dict()
+
+_SHUTDOWN_EMBED = DiscordEmbed(
+    title="🔴 Sentiment Bot Offline",
+    description="Bot has been stopped. No more alerts will be sent.",
+    color=0x808080,  # Gray
+    fields=[],
+    footer="Hyperliquid Trade Journal"
+).to_dict()
+
+_ERROR_EMBED = DiscordEmbed(
+    title="⚠️ Sentiment Bot Error",
+    description="",
+    color=0xFF6B6B,  # Red-ish
+    fields=[],
+    footer="Check logs for details"
+).to_dict()
+
+
 class DiscordWebhook:
     """Discord webhook client for sending alerts."""
 
+    # Consecutive batch alerts sharing sentiment and primary asset are merged
+    # into one embed once the run reaches this size
+    merge_threshold: int = 3
+
     def __init__(self, webhook_url: str, bot_name: str = "Sentiment Bot", avatar_url: Optional[str] = None):
         """
         Initialize Discord webhook client.
@@ -119,15 +178,58 @@ class DiscordWebhook:
         self.webhook_url = webhook_url
         self.bot_name = bot_name
         self.avatar_url = avatar_url
-        self._session = _get_http_session()
-        self._last_request_time = 0.0
+        self._session = _http_session
+        self._tokens = float(RATE_LIMIT_BURST)
+        self._last_refill = time.monotonic()
+        self._rate_lock = threading.Lock()
+
+        # Background delivery for alerts that don't need a result
+        self._queue: queue.Queue[Optional[dict]] = queue.Queue(maxsize=SEND_QUEUE_MAXSIZE)
+        self._sender: Optional[threading.Thread] = None
+        self._sender_lock = threading.Lock()
+        self._closed = False
 
     def _rate_limit(self) -> None:
-        """Enforce minimum interval between requests."""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < MIN_REQUEST_INTERVAL:
-            time.sleep(MIN_REQUEST_INTERVAL - elapsed)
-        self._last_request_time = time.time()
+        """Take a token from the rate-limit bucket, waiting for a refill if empty."""
+        refill_rate = RATE_LIMIT_PER_MINUTE / 60.0
+        with self._rate_lock:
+            now = time.monotonic()
+            self._tokens = min(RATE_LIMIT_BURST, self._tokens + (now - self._last_refill) * refill_rate)
+            self._last_refill = now
+            # A negative balance reserves a future token, so concurrent
+            # callers queue up behind each other instead of all waking at once
+            self._tokens -= 1
+            wait = -self._tokens / refill_rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+    def _sync_rate_limit(self, response: requests.Response) -> None:
+        """Clamp the local bucket to Discord's X-RateLimit-Remaining count."""
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        if remaining is None:
+            return
+        try:
+            remaining = float(remaining)
+        except ValueError:
+            return
+        # Only ever lower the balance: Discord's bucket is per webhook and
+        # can be shared with other senders, ours is the client-side ceiling
+        with self._rate_lock:
+            self._tokens = min(self._tokens, remaining)
+
+    @staticmethod
+    def _retry_after(response: requests.Response) -> float:
+        """Seconds to wait after a 429, from headers with a JSON body fallback."""
+        header = response.headers.get("Retry-After") or response.headers.get("X-RateLimit-Reset-After")
+        if header:
+            try:
+                return float(header)
+            except ValueError:
+                pass
+        try:
+            return float(orjson.loads(response.content).get("retry_after", 5))
+        except (orjson.JSONDecodeError, AttributeError, TypeError, ValueError):
+            return 5.0
 
     def _send_request(self, payload: dict) -> bool:
         """
@@ -141,25 +243,32 @@ class DiscordWebhook:
         """
         self._rate_limit()
 
+        # Encoded once; the 429 retry resends the same bytes
+        body = orjson.dumps(payload)
+        headers = {"Content-Type": "application/json"}
+
         try:
             response = self._session.post(
                 self.webhook_url,
-                json=payload,
+                data=body,
+                headers=headers,
                 timeout=REQUEST_TIMEOUT
             )
 
             # Handle rate limiting
             if response.status_code == 429:
-                retry_after = response.json().get("retry_after", 5)
+                retry_after = self._retry_after(response)
                 logger.warning("Discord rate limited, waiting %s seconds", retry_after)
                 time.sleep(retry_after)
                 # Retry once
                 response = self._session.post(
                     self.webhook_url,
-                    json=payload,
+                    data=body,
+                    headers=headers,
                     timeout=REQUEST_TIMEOUT
                 )
 
+            self._sync_rate_limit(response)
             response.raise_for_status()
             return True
 
@@ -167,39 +276,103 @@ class DiscordWebhook:
             logger.error("Discord webhook error: %s", e)
             return False
 
-    def send_message(self, content: str) -> bool:
+    def _ensure_sender(self) -> None:
+        """Start the background sender thread if it isn't running."""
+        if self._sender is not None and self._sender.is_alive():
+            return
+        with self._sender_lock:
+            if self._closed:
+                return
+            if self._sender is None or not self._sender.is_alive():
+                self._sender = threading.Thread(
+                    target=self._drain_queue,
+                    name="discord-sender",
+                    daemon=True
+                )
+                self._sender.start()
+
+    def _drain_queue(self) -> None:
         """
-        Send a simple text message.
+        Send queued embeds until close() enqueues the stop sentinel (None).
 
-        Args:
-            content: Message text (max 2000 chars)
+        Embeds that queued up while the previous message was rate limited
+        are combined into a single message (up to Discord's limit).
+        """
+        stopping = False
+        while not stopping:
+            embed = self._queue.get()
+            if embed is None:
+                return
+            embeds = [embed]
+            while len(embeds) < MAX_EMBEDS_PER_MESSAGE:
+                try:
+                    embed = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if embed is None:
+                    stopping = True
+                    break
+                embeds.append(embed)
 
-        Returns:
-            True if successful
+            try:
+                self._send_embed_dicts(embeds)
+            except Exception as e:
+                logger.error("Discord background send failed: %s", e)
+
+    def close(self, timeout: float = SENDER_CLOSE_TIMEOUT) -> None:
         """
-        payload = {
-            "username": self.bot_name,
-            "content": content[:2000]
-        }
+        Deliver any queued embeds and stop the background sender thread.
 
-        if self.avatar_url:
-            payload["avatar_url"] = self.avatar_url
+        Embeds queued after close() are sent synchronously instead.
 
-        return self._send_request(payload)
+        Args:
+            timeout: Seconds to wait for the queue to drain
+        """
+        with self._sender_lock:
+            self._closed = True
+            sender = self._sender
+            self._sender = None
+        if sender is None or not sender.is_alive():
+            return
 
-    def send_embed(self, embed: DiscordEmbed) -> bool:
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            logger.warning("Discord send queue still full on close, dropping queued embeds")
+            return
+        sender.join(timeout)
+        if sender.is_alive():
+            logger.warning("Discord sender did not finish within %ss", timeout)
+
+    def queue_embed(self, embed: DiscordEmbed) -> bool:
         """
-        Send a single embed.
+        Queue an embed for background delivery.
 
         Args:
             embed: DiscordEmbed object
 
         Returns:
-            True if successful
+            True if queued, False if the queue is full
         """
+        return self._queue_embed_dict(embed.to_dict())
+
+    def _queue_embed_dict(self, embed: dict) -> bool:
+        """Queue an embed already in Discord API format for background delivery."""
+        if self._closed:
+            return self._send_embed_dicts([embed])
+        try:
+            self._queue.put_nowait(embed)
+        except queue.Full:
+            logger.warning("Discord send queue full, dropping embed: %s", embed.get("title"))
+            return False
+        self._ensure_sender()
+        return True
+
+    def _send_embed_dicts(self, embeds: list[dict]) -> bool:
+        """Send embeds already in Discord API format as one message."""
         payload = {
             "username": self.bot_name,
-            "embeds": [embed.to_dict()]
+            "embeds": embeds
         }
 
         if self.avatar_url:
@@ -207,25 +380,19 @@ class DiscordWebhook:
 
         return self._send_request(payload)
 
-    def send_embeds(self, embeds: list[DiscordEmbed]) -> bool:
+    def send_message(self, content: str) -> bool:
         """
-        Send multiple embeds in one message.
+        Send a simple text message.
 
         Args:
-            embeds: List of DiscordEmbed objects (max 10)
+            content: Message text (max 2000 chars)
 
         Returns:
             True if successful
         """
-        if not embeds:
-            return True
-
-        # Discord allows max 10 embeds per message
-        embeds = embeds[:MAX_EMBEDS_PER_MESSAGE]
-
         payload = {
             "username": self.bot_name,
-            "embeds": [e.to_dict() for e in embeds]
+            "content": content[:2000]
         }
 
         if self.avatar_url:
@@ -233,24 +400,42 @@ class DiscordWebhook:
 
         return self._send_request(payload)
 
-    def send_sentiment_alert(self, result: SentimentResult, news_url: Optional[str] = None) -> bool:
+    def send_embed(self, embed: DiscordEmbed) -> bool:
         """
-        Send a formatted sentiment alert.
+        Send a single embed.
 
         Args:
-            result: SentimentResult to send
-            news_url: Optional URL to the news article
+            embed: DiscordEmbed object
 
         Returns:
             True if successful
         """
-        # Build embed
+        return self._send_embed_dicts([embed.to_dict()])
+
+    def send_embeds(self, embeds: list[DiscordEmbed]) -> bool:
+        """
+        Send multiple embeds in one message.
+
+        Args:
+            embeds: List of DiscordEmbed objects (max 10)
+
+        Returns:
+            True if successful
+        """
+        if not embeds:
+            return True
+
+        # Discord allows max 10 embeds per message
+        return self._send_embed_dicts([e.to_dict() for e in embeds[:MAX_EMBEDS_PER_MESSAGE]])
+
+    def _build_alert_embed(self, result: SentimentResult, news_url: Optional[str] = None) -> DiscordEmbed:
+        """Build the full embed for a single sentiment alert."""
         sentiment_emoji = SENTIMENT_EMOJI.get(result.sentiment, "❓")
         strength_emoji = STRENGTH_EMOJI.get(result.signal_strength, "")
         color = COLORS.get(result.sentiment, 0x808080)
 
         # Title with sentiment
-        title = f"{sentiment_emoji} {result.sentiment.value.upper().replace('_', ' ')}"
+        title = f"{sentiment_emoji} {SENTIMENT_LABELS[result.sentiment]}"
         if result.signal_strength in (SignalStrength.STRONG, SignalStrength.MODERATE):
             title += f" {strength_emoji}"
 
@@ -271,7 +456,7 @@ class DiscordWebhook:
             },
             {
                 "name": "Signal",
-                "value": f"{result.signal_strength.value.title()}",
+                "value": STRENGTH_LABELS[result.signal_strength],
                 "inline": True
             },
             {
@@ -286,7 +471,7 @@ class DiscordWebhook:
             }
         ]
 
-        embed = DiscordEmbed(
+        return DiscordEmbed(
             title=title,
             description=description,
             color=color,
@@ -296,12 +481,124 @@ class DiscordWebhook:
             url=news_url
         )
 
-        return self.send_embed(embed)
+    def send_sentiment_alert(self, result: SentimentResult, news_url: Optional[str] = None) -> bool:
+        """
+        Send a formatted sentiment alert.
+
+        Args:
+            result: SentimentResult to send
+            news_url: Optional URL to the news article
+
+        Returns:
+            True if successful
+        """
+        return self.send_embed(self._build_alert_embed(result, news_url))
+
+    def queue_sentiment_alert(self, result: SentimentResult, news_url: Optional[str] = None) -> bool:
+        """
+        Queue a formatted sentiment alert for background delivery.
+
+        Args:
+            result: SentimentResult to send
+            news_url: Optional URL to the news article
+
+        Returns:
+            True if queued
+        """
+        return self.queue_embed(self._build_alert_embed(result, news_url))
+
+    def _build_batch_embed(self, result: SentimentResult, news_url: Optional[str] = None) -> dict:
+        """
+        Build the compact embed used for one alert in a batch message.
+
+        Returned directly in Discord API format: every part is already within
+        Discord's limits, so DiscordEmbed.to_dict's truncation and optional
+        footer/timestamp handling would be wasted work.
+        """
+        sentiment_emoji = SENTIMENT_EMOJI.get(result.sentiment, "❓")
+        strength_emoji = STRENGTH_EMOJI.get(result.signal_strength, "")
+        color = COLORS.get(result.sentiment, 0x808080)
+
+        title = f"{sentiment_emoji} {SENTIMENT_LABELS[result.sentiment]}"
+        if result.signal_strength in (SignalStrength.STRONG, SignalStrength.MODERATE):
+            title += f" {strength_emoji}"
+
+        # Compact fields for batch
+        fields = [
+            {
+                "name": "Assets",
+                "value": ", ".join(result.assets) if result.assets else "Crypto",
+                "inline": True
+            },
+            {
+                "name": "Confidence",
+                "value": f"{int(result.confidence * 100)}%",
+                "inline": True
+            },
+            {
+                "name": "Impact",
+                "value": f"{result.price_impact.upper()}",
+                "inline": True
+            }
+        ]
+
+        embed = {
+            "title": title,
+            "description": f"**{result.title[:200]}**\n\n{result.reasoning[:500]}",
+            "color": color,
+            "fields": fields
+        }
+        if news_url:
+            embed["url"] = news_url
+        return embed
+
+    def _build_merged_embed(self, results: list[SentimentResult], news_urls: dict[str, str]) -> dict:
+        """
+        Build one embed summarizing alerts that share sentiment and primary asset.
+
+        Args:
+            results: Alerts in the group (at least two)
+            news_urls: Dict mapping news_id to URL
+
+        Returns:
+            Embed in Discord API format listing the top headlines and a count
+        """
+        first = results[0]
+        asset = first.assets[0] if first.assets else "Crypto"
+        title = f"{SENTIMENT_EMOJI.get(first.sentiment, '❓')} {SENTIMENT_LABELS[first.sentiment]} · {asset} ×{len(results)}"
+
+        top = sorted(results, key=lambda r: r.confidence, reverse=True)[:3]
+        lines = []
+        for result in top:
+            url = news_urls.get(result.news_id)
+            headline = result.title[:150]
+            lines.append(f"• [{headline}]({url})" if url else f"• {headline}")
+        if len(results) > len(top):
+            lines.append(f"…and {len(results) - len(top)} more")
+
+        assets = sorted({a for result in results for a in result.assets})
+        return {
+            "title": title,
+            "description": "\n".join(lines),
+            "color": COLORS.get(first.sentiment, 0x808080),
+            "fields": [
+                {"name": "Events", "value": str(len(results)), "inline": True},
+                {"name": "Top Confidence", "value": f"{int(top[0].confidence * 100)}%", "inline": True},
+                {"name": "Assets", "value": ", ".join(assets[:10]) or "Crypto", "inline": True}
+            ]
+        }
 
     def send_batch_alerts(self, results: list[SentimentResult], news_urls: Optional[dict[str, str]] = None) -> int:
         """
         Send multiple sentiment alerts efficiently.
 
+        Messages (up to MAX_EMBEDS_PER_MESSAGE alerts each) go out one after
+        another on the shared keep-alive session: Discord shows them in
+        arrival order, and the token bucket lets the first RATE_LIMIT_BURST
+        through without waiting. Runs of merge_threshold or more consecutive
+        alerts with the same sentiment and primary asset become a single
+        embed; alerts are never reordered.
+
         Args:
             results: List of SentimentResult objects
             news_urls: Optional dict mapping news_id to URL
@@ -315,50 +612,23 @@ class DiscordWebhook:
         news_urls = news_urls or {}
         sent_count = 0
 
-        # Group by batches of 10 (Discord limit)
-        for i in range(0, len(results), MAX_EMBEDS_PER_MESSAGE):
-            batch = results[i:i + MAX_EMBEDS_PER_MESSAGE]
-            embeds = []
-
-            for result in batch:
-                sentiment_emoji = SENTIMENT_EMOJI.get(result.sentiment, "❓")
-                strength_emoji = STRENGTH_EMOJI.get(result.signal_strength, "")
-                color = COLORS.get(result.sentiment, 0x808080)
-
-                title = f"{sentiment_emoji} {result.sentiment.value.upper().replace('_', ' ')}"
-                if result.signal_strength in (SignalStrength.STRONG, SignalStrength.MODERATE):
-                    title += f" {strength_emoji}"
-
-                # Compact fields for batch
-                fields = [
-                    {
-                        "name": "Assets",
-                        "value": ", ".join(result.assets) if result.assets else "Crypto",
-                        "inline": True
-                    },
-                    {
-                        "name": "Confidence",
-                        "value": f"{int(result.confidence * 100)}%",
-                        "inline": True
-                    },
-                    {
-                        "name": "Impact",
-                        "value": f"{result.price_impact.upper()}",
-                        "inline": True
-                    }
-                ]
-
-                embed = DiscordEmbed(
-                    title=title,
-                    description=f"**{result.title[:200]}**\n\n{result.reasoning[:500]}",
-                    color=color,
-                    fields=fields,
-                    url=news_urls.get(result.news_id)
-                )
-                embeds.append(embed)
-
-            if self.send_embeds(embeds):
-                sent_count += len(embeds)
+        # Build every embed up front so the send loop only waits on the network;
+        # each embed is paired with the number of alerts it carries. Only
+        # adjacent alerts with the same (sentiment, primary asset) are merged.
+        embeds: list[tuple[dict, int]] = []
+        runs = groupby(results, key=lambda r: (r.sentiment, r.assets[0] if r.assets else None))
+        for _, run in runs:
+            group = list(run)
+            if len(group) >= self.merge_threshold:
+                embeds.append((self._build_merged_embed(group, news_urls), len(group)))
+            else:
+                embeds.extend((self._build_batch_embed(result, news_urls.get(result.news_id)), 1) for result in group)
+
+        # Group by batches of 10 (Discord limit); a single batch is one request
+        for i in range(0, len(embeds), MAX_EMBEDS_PER_MESSAGE):
+            batch = embeds[i:i + MAX_EMBEDS_PER_MESSAGE]
+            if self._send_embed_dicts([embed for embed, _ in batch]):
+                sent_count += sum(count for _, count in batch)
 
         logger.info("Sent %d/%d alerts to Discord", sent_count, len(results))
         return sent_count
@@ -400,15 +670,19 @@ class DiscordWebhook:
             overall = "➖ Mixed"
 
         # Build description
-        description = f"**Overall Sentiment:** {overall}\n\n"
-        description += f"🟢 Bullish: {bullish_count}\n"
-        description += f"🔴 Bearish: {bearish_count}\n"
-        description += f"⚪ Neutral: {neutral_count}\n"
+        parts = [
+            f"**Overall Sentiment:** {overall}\n\n",
+            f"🟢 Bullish: {bullish_count}\n",
+            f"🔴 Bearish: {bearish_count}\n",
+            f"⚪ Neutral: {neutral_count}\n"
+        ]
 
         # Top assets
         if top_assets:
             assets_str = ", ".join([f"**{asset}** ({count})" for asset, count in top_assets[:5]])
-            description += f"\n**Trending Assets:** {assets_str}"
+            parts.append(f"\n**Trending Assets:** {assets_str}")
+
+        description = "".join(parts)
 
         embed = DiscordEmbed(
             title=f"📊 Sentiment Summary | {period}",
@@ -416,7 +690,7 @@ class DiscordWebhook:
             color=color,
             fields=[],
             footer="Hyperliquid Sentiment Bot",
-            timestamp=datetime.now(timezone.utc).isoformat()
+            timestamp=_iso_now()
         )
 
         return self.send_embed(embed)
@@ -431,48 +705,19 @@ class DiscordWebhook:
         Returns:
             True if successful
         """
-        embed = DiscordEmbed(
-            title="⚠️ Sentiment Bot Error",
-            description=f"```\n{error_message[:3000]}\n```",
-            color=0xFF6B6B,  # Red-ish
-            fields=[],
-            footer="Check logs for details",
-            timestamp=datetime.now(timezone.utc).isoformat()
-        )
-
-        return self.send_embed(embed)
+        return self._send_embed_dicts([{
+            **_ERROR_EMBED,
+            "description": f"```\n{error_message[:3000]}\n```",
+            "timestamp": _iso_now()
+        }])
 
     def send_startup_message(self) -> bool:
-        """Send a message indicating the bot has started."""
-        embed = DiscordEmbed(
-            title="🤖 Sentiment Bot Online",
-            description="Monitoring crypto news for trading signals...",
-            color=0x00BFFF,  # Deep sky blue
-            fields=[
-                {
-                    "name": "Features",
-                    "value": "• Real-time news monitoring\n• AI sentiment analysis\n• Actionable trading signals",
-                    "inline": False
-                }
-            ],
-            footer="Hyperliquid Trade Journal",
-            timestamp=datetime.now(timezone.utc).isoformat()
-        )
-
-        return self.send_embed(embed)
+        """Queue a message indicating the bot has started."""
+        return self._queue_embed_dict({**_STARTUP_EMBED, "timestamp": _iso_now()})
 
     def send_shutdown_message(self) -> bool:
         """Send a message indicating the bot is stopping."""
-        embed = DiscordEmbed(
-            title="🔴 Sentiment Bot Offline",
-            description="Bot has been stopped. No more alerts will be sent.",
-            color=0x808080,  # Gray
-            fields=[],
-            footer="Hyperliquid Trade Journal",
-            timestamp=datetime.now(timezone.utc).isoformat()
-        )
-
-        return self.send_embed(embed)
+        return self._send_embed_dicts([{**_SHUTDOWN_EMBED, "timestamp": _iso_now()}])
 
     def test_connection(self) -> bool:
         """
@@ -4,12 +4,13 @@ Stores news items, sentiment analysis results, and alert delivery status.
 """
 
 import logging
+import threading
 from datetime import datetime, timezone
 from typing import Optional
 
 from sqlalchemy import (
     Column, String, Float, Text, Boolean, DateTime, Integer,
-    Index, ForeignKey, Enum as SQLEnum, create_engine
+    Index, ForeignKey, Enum as SQLEnum, create_engine, insert
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship, sessionmaker, Session
@@ -26,6 +27,15 @@ POOL_SIZE = 3
 POOL_MAX_OVERFLOW = 5
 POOL_TIMEOUT = 30
 
+# Compiled SQL statements kept per engine (SQLAlchemy default is 500)
+QUERY_CACHE_SIZE = 1200
+
+# Max ids per IN (...) lookup
+NEWS_ID_CHUNK_SIZE = 500
+
+# PostgreSQL's bound-parameter limit per statement, less some headroom
+MAX_BIND_PARAMS = 65000
+
 
 class NewsRecord(Base):
     """Stored news item from aggregator."""
@@ -161,40 +171,63 @@ class BotStatus(Base):
 # Database session management
 _engine = None
 _SessionLocal = None
+_engine_url: Optional[str] = None
+_init_lock = threading.Lock()
 
 
 def init_sentiment_db(database_url: str) -> bool:
     """
     Initialize the sentiment database tables.
 
+    Safe to call on every request: once an engine exists for the same URL
+    this returns immediately and the warm connection pool is reused.
+
     Args:
         database_url: PostgreSQL connection string
 
     Returns:
         True if successful
     """
-    global _engine, _SessionLocal
-
     if not database_url:
         logger.error("No database URL provided for sentiment DB")
         return False
 
+    if _SessionLocal is not None and _engine_url == database_url:
+        return True
+
+    with _init_lock:
+        if _SessionLocal is not None and _engine_url == database_url:
+            return True
+        return _create_engine(database_url)
+
+
+def _create_engine(database_url: str) -> bool:
+    """Create the engine, tables and session factory for database_url."""
+    global _engine, _SessionLocal, _engine_url
+
     try:
         # Handle Railway postgres:// URL
         db_url = database_url.replace("postgres://", "postgresql+psycopg://")
         db_url = db_url.replace("postgresql://", "postgresql+psycopg://")
 
-        _engine = create_engine(
+        engine = create_engine(
             db_url,
             poolclass=QueuePool,
             pool_size=POOL_SIZE,
             max_overflow=POOL_MAX_OVERFLOW,
             pool_timeout=POOL_TIMEOUT,
-            pool_pre_ping=True
+            pool_pre_ping=True,
+            query_cache_size=QUERY_CACHE_SIZE
         )
 
-        Base.metadata.create_all(_engine)
-        _SessionLocal = sessionmaker(bind=_engine)
+        Base.metadata.create_all(engine)
+
+        previous = _engine
+        _engine = engine
+        _SessionLocal = sessionmaker(bind=engine)
+        _engine_url = database_url
+        if previous is not None:
+            previous.dispose()
 
         logger.info("Sentiment database initialized")
         return True
@@ -228,28 +261,63 @@ class SignalRepository:
         Returns:
             NewsRecord instance
         """
-        import json
-
-        existing = self.session.query(NewsRecord).filter(NewsRecord.id == news_item.id).first()
+        existing = self.session.get(NewsRecord, news_item.id)
         if existing:
             return existing
 
-        record = NewsRecord(
-            id=news_item.id,
-            title=news_item.title,
-            url=news_item.url,
-            source=news_item.source.value,
-            source_name=news_item.source_name,
-            published_at=news_item.published_at,
-            currencies=json.dumps(news_item.currencies),
-            raw_sentiment=news_item.raw_sentiment,
-            fetched_at=news_item.fetched_at
-        )
+        record = NewsRecord(**self._news_row(news_item))
 
         self.session.add(record)
         self.session.flush()
         return record
 
+    @staticmethod
+    def _news_row(news_item) -> dict:
+        """Column values for a NewsRecord built from an aggregator NewsItem."""
+        import json
+
+        return {
+            "id": news_item.id,
+            "title": news_item.title,
+            "url": news_item.url,
+            "source": news_item.source.value,
+            "source_name": news_item.source_name,
+            "published_at": news_item.published_at,
+            "currencies": json.dumps(news_item.currencies),
+            "raw_sentiment": news_item.raw_sentiment,
+            "fetched_at": news_item.fetched_at
+        }
+
+    def save_news_bulk(self, news_items: list) -> int:
+        """
+        Save many news items with one existence check and one executemany INSERT.
+
+        Items already stored (or repeated within news_items) are skipped.
+        Rows are inserted through Core, so no NewsRecord objects are loaded
+        into the session.
+
+        Args:
+            news_items: NewsItems from aggregator
+
+        Returns:
+            Number of rows inserted
+        """
+        existing = self.news_exists_many([item.id for item in news_items])
+        rows = []
+        for item in news_items:
+            if item.id in existing:
+                continue
+            existing.add(item.id)
+            rows.append(self._news_row(item))
+
+        if rows:
+            # Each statement stays under the bound-parameter limit even if
+            # the driver packs its rows into one multi-row VALUES
+            batch_size = max(1, MAX_BIND_PARAMS // len(rows[0]))
+            for i in range(0, len(rows), batch_size):
+                self.session.execute(insert(NewsRecord), rows[i:i + batch_size])
+        return len(rows)
+
     def save_signal(self, result, news_item=None) -> SignalRecord:
         """
         Save a sentiment signal to the database.
@@ -312,7 +380,7 @@ class SignalRepository:
         Returns:
             True if updated
         """
-        signal = self.session.query(SignalRecord).filter(SignalRecord.id == signal_id).first()
+        signal = self.session.get(SignalRecord, signal_id)
         if not signal:
             return False
 
@@ -425,7 +493,41 @@ class SignalRepository:
 
     def news_exists(self, news_id: str) -> bool:
         """Check if a news item already exists."""
-        return self.session.query(NewsRecord).filter(NewsRecord.id == news_id).first() is not None
+        return self.session.get(NewsRecord, news_id) is not None
+
+    def news_exists_many(self, news_ids: list[str]) -> set[str]:
+        """
+        Find which news items already exist, in one query per chunk of ids.
+
+        Args:
+            news_ids: News IDs to check
+
+        Returns:
+            Set of the IDs that are already stored
+        """
+        existing: set[str] = set()
+        for i in range(0, len(news_ids), NEWS_ID_CHUNK_SIZE):
+            chunk = news_ids[i:i + NEWS_ID_CHUNK_SIZE]
+            rows = self.session.query(NewsRecord.id).filter(NewsRecord.id.in_(chunk))
+            existing.update(row.id for row in rows)
+        return existing
+
+    def get_recent_news_ids(self, limit: int = 1000) -> list[str]:
+        """
+        Get the IDs of the most recently published stored news items.
+
+        Args:
+            limit: Maximum number of IDs to return
+
+        Returns:
+            News IDs, newest first
+        """
+        rows = (
+            self.session.query(NewsRecord.id)
+            .order_by(NewsRecord.published_at.desc())
+            .limit(limit)
+        )
+        return [row.id for row in rows]
 
     def cleanup_old_records(self, days: int = 30) -> int:
         """
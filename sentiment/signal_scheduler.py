@@ -30,6 +30,9 @@ DEFAULT_POLL_INTERVAL = 300  # 5 minutes
 MIN_POLL_INTERVAL = 60  # 1 minute minimum
 MAX_POLL_INTERVAL = 3600  # 1 hour maximum
 
+# Stored news IDs loaded into the aggregator's seen window on startup
+SEEN_WARMUP_LIMIT = 1000
+
 
 class SentimentBot:
     """
@@ -51,7 +54,8 @@ class SentimentBot:
         poll_interval: int = DEFAULT_POLL_INTERVAL,
         bot_name: str = "Sentiment Bot",
         twitter_enabled: bool = True,
-        twitter_accounts: Optional[list[str]] = None
+        twitter_accounts: Optional[list[str]] = None,
+        prefilter: bool = False
     ):
         """
         Initialize the sentiment bot.
@@ -65,6 +69,7 @@ class SentimentBot:
             bot_name: Display name for Discord messages
             twitter_enabled: Enable Twitter tracking via Nitter RSS
             twitter_accounts: List of Twitter usernames to track
+            prefilter: Skip Claude for headlines with no market-moving keywords
         """
         # Validate required params
         if not database_url:
@@ -88,7 +93,7 @@ class SentimentBot:
             twitter_accounts=twitter_accounts
         )
 
-        self.analyzer = SentimentAnalyzer(api_key=anthropic_api_key)
+        self.analyzer = SentimentAnalyzer(api_key=anthropic_api_key, prefilter=prefilter)
 
         self.discord = DiscordWebhook(
             webhook_url=discord_webhook_url,
@@ -112,8 +117,26 @@ class SentimentBot:
         """Ensure database is initialized."""
         if not self._db_initialized:
             self._db_initialized = init_sentiment_db(self._db_url)
+            if self._db_initialized:
+                self._warm_seen_urls()
         return self._db_initialized
 
+    def _warm_seen_urls(self) -> None:
+        """Seed the aggregator's seen window from stored news after a restart."""
+        session = get_sentiment_session()
+        if not session:
+            return
+
+        try:
+            news_ids = SignalRepository(session).get_recent_news_ids(limit=SEEN_WARMUP_LIMIT)
+            # Oldest first, so the newest are the last to be evicted
+            self.aggregator.mark_seen(reversed(news_ids))
+            logger.info("Loaded %d stored news IDs into the seen window", len(news_ids))
+        except Exception as e:
+            logger.warning("Failed to load stored news IDs: %s", e)
+        finally:
+            session.close()
+
     def _get_scheduler(self) -> BackgroundScheduler:
         """Get or create the scheduler."""
         if self._scheduler is None:
@@ -160,7 +183,8 @@ class SentimentBot:
 
             try:
                 repo = SignalRepository(session)
-                new_items = [item for item in news_items if not repo.news_exists(item.id)]
+                existing = repo.news_exists_many([item.id for item in news_items])
+                new_items = [item for item in news_items if item.id not in existing]
 
                 if not new_items:
                     logger.info("All news items already processed")
@@ -174,15 +198,15 @@ class SentimentBot:
                 logger.info("Found %d actionable signals", len(results))
 
                 # Save all news and signals to DB
-                news_map = {item.id: item for item in new_items}
                 url_map = {item.id: item.url for item in new_items}
 
-                for item in new_items:
-                    repo.save_news(item)
+                repo.save_news_bulk(new_items)
 
+                # News rows are already stored, so save_signal doesn't re-check them
+                signal_ids = {}
                 for result in results:
-                    news_item = news_map.get(result.news_id)
-                    record = repo.save_signal(result, news_item)
+                    record = repo.save_signal(result)
+                    signal_ids[result.news_id] = record.id
                     self._total_signals += 1
 
                 session.commit()
@@ -192,12 +216,11 @@ class SentimentBot:
                     sent = self.discord.send_batch_alerts(results, news_urls=url_map)
                     self._total_alerts += sent
 
-                    # Mark alerts as sent
-                    from .models import SignalRecord
-                    for result in results:
-                        signal = session.query(SignalRecord).filter_by(news_id=result.news_id).first()
-                        if signal:
-                            repo.mark_alert_sent(signal.id, "discord")
+                    # Mark alerts as sent by primary key, saved before the commit;
+                    # the records were expired by it, so each is reloaded by ID
+                    # rather than queried by news_id
+                    for signal_id in signal_ids.values():
+                        repo.mark_alert_sent(signal_id, "discord")
 
                     session.commit()
                     logger.info("Sent %d alerts to Discord", sent)
@@ -369,7 +392,7 @@ class SentimentBot:
         return self.discord.test_connection()
 
     def send_test_alert(self) -> bool:
-        """Send a test alert to Discord."""
+        """Queue a test alert for Discord."""
         from .analyzer import SentimentScore, SignalStrength
 
         test_result = SentimentResult(
@@ -384,7 +407,7 @@ class SentimentBot:
             timeframe="short_term"
         )
 
-        return self.discord.send_sentiment_alert(test_result)
+        return self.discord.queue_sentiment_alert(test_result)
 
 
 # Global bot instance for app integration
@@ -404,7 +427,8 @@ def create_sentiment_bot(
     cryptopanic_api_key: Optional[str] = None,
     poll_interval: int = DEFAULT_POLL_INTERVAL,
     twitter_enabled: bool = True,
-    twitter_accounts: Optional[list[str]] = None
+    twitter_accounts: Optional[list[str]] = None,
+    prefilter: bool = False
 ) -> SentimentBot:
     """
     Create and store the global bot instance.
@@ -417,6 +441,7 @@ def create_sentiment_bot(
         poll_interval: Seconds between polls
         twitter_enabled: Enable Twitter tracking via Nitter RSS
         twitter_accounts: List of Twitter usernames to track
+        prefilter: Skip Claude for headlines with no market-moving keywords
 
     Returns:
         SentimentBot instance
@@ -435,7 +460,8 @@ def create_sentiment_bot(
             cryptopanic_api_key=cryptopanic_api_key,
             poll_interval=poll_interval,
             twitter_enabled=twitter_enabled,
-            twitter_accounts=twitter_accounts
+            twitter_accounts=twitter_accounts,
+            prefilter=prefilter
         )
 
         return _bot_instance
@@ -448,4 +474,6 @@ def destroy_sentiment_bot() -> None:
     with _bot_lock:
         if _bot_instance is not None:
             _bot_instance.stop(send_shutdown_message=False)
+            # Flush queued alerts and end the webhook's sender thread
+            _bot_instance.discord.close()
             _bot_instance = None
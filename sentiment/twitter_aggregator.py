@@ -4,10 +4,10 @@ Fetches tweets from crypto influencer accounts via Nitter instances.
 Nitter provides RSS feeds without requiring Twitter API access.
 """
 
-import hashlib
 import logging
 import time
 from dataclasses import dataclass
+from collections import OrderedDict
 from datetime import datetime, timezone
 from typing import Optional
 from html import unescape
@@ -18,6 +18,8 @@ import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from .aggregator import _hash_url, _remember_seen
+
 logger = logging.getLogger(__name__)
 
 # Request configuration
@@ -67,9 +69,9 @@ def _get_http_session() -> requests.Session:
     return session
 
 
-def _hash_url(url: str) -> str:
-    """Generate a unique ID from URL."""
-    return hashlib.sha256(url.encode()).hexdigest()[:16]
+# Shared by every aggregator instance so pooled keep-alive connections
+# survive across polls and the per-request aggregators in the debug endpoint
+_http_session = _get_http_session()
 
 
 def _clean_tweet_text(text: str) -> str:
@@ -99,7 +101,7 @@ def _extract_twitter_url(nitter_url: str) -> str:
     return nitter_url
 
 
-@dataclass
+@dataclass(slots=True)
 class TweetItem:
     """Raw tweet item before normalization."""
     id: str
@@ -126,8 +128,8 @@ class TwitterAggregator:
         """
         self.accounts = accounts or DEFAULT_TWITTER_ACCOUNTS
         self._extract_assets = extract_assets_func
-        self._session = _get_http_session()
-        self._seen_urls: set[str] = set()
+        self._session = _http_session
+        self._seen_urls: OrderedDict[str, None] = OrderedDict()
         self._working_instance: Optional[str] = None
 
     def _find_working_instance(self) -> Optional[str]:
@@ -260,7 +262,7 @@ class TwitterAggregator:
                 unique_tweets.append(tweet)
 
         # Update seen URLs
-        self._seen_urls.update(seen_ids)
+        _remember_seen(self._seen_urls, seen_ids)
 
         # Sort by published time (newest first)
         unique_tweets.sort(key=lambda x: x.published_at, reverse=True)
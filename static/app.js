@@ -442,12 +442,17 @@ async function syncTrades() {
             loadFunding()
         ]);
 
-        const data = await tradesRes.json();
+        let data = await tradesRes.json();
 
         if (!tradesRes.ok) {
             throw new Error(data.error || 'Sync failed');
         }
 
+        // Sync runs in the background; wait for the job to finish
+        if (tradesRes.status === 202) {
+            data = await waitForSyncJob(data.job_id);
+        }
+
         showStatus(`Synced ${data.total_trades} fills`, 'success');
         updateSyncTimestamp(wallet);
         await loadRoundTrips();
@@ -460,6 +465,27 @@ async function syncTrades() {
     }
 }
 
+// Poll interval and give-up time while waiting for a background sync job
+const SYNC_POLL_INTERVAL_MS = 1000;
+const SYNC_MAX_WAIT_MS = 5 * 60 * 1000;
+
+async function waitForSyncJob(jobId) {
+    const deadline = Date.now() + SYNC_MAX_WAIT_MS;
+    while (Date.now() < deadline) {
+        await new Promise(resolve => setTimeout(resolve, SYNC_POLL_INTERVAL_MS));
+        const res = await fetch(`/api/trades/sync/status?job=${encodeURIComponent(jobId)}`);
+        const job = await res.json();
+
+        if (!res.ok || job.state === 'error') {
+            throw new Error(job.error || 'Sync failed');
+        }
+        if (job.state === 'done') {
+            return job;
+        }
+    }
+    throw new Error('Sync is taking too long, try again later');
+}
+
 function showStatus(message, type) {
     syncStatus.textContent = message;
     syncStatus.className = 'status ' + type;
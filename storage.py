@@ -1,6 +1,8 @@
 import os
 import time
 import hashlib
+import threading
+from collections import OrderedDict
 from contextlib import contextmanager
 from typing import Generator
 from sqlalchemy import create_engine, Column, String, Float, Integer, Text, BigInteger, Index
@@ -19,8 +21,16 @@ POOL_MAX_OVERFLOW = 10
 POOL_TIMEOUT = 30
 
 # Cache settings
-ROUND_TRIP_CACHE_TTL = 30  # seconds
-_round_trip_cache: dict[str, tuple[float, list]] = {}
+WALLET_CACHE_TTL = 30  # seconds
+WALLET_CACHE_MAXSIZE = 512  # wallets kept, least recently used evicted first
+# Per-wallet LRU of derived results: {wallet: {kind: (cached_at, result)}}
+_wallet_cache: OrderedDict[str, dict[str, tuple[float, object]]] = OrderedDict()
+_wallet_cache_lock = threading.Lock()
+# Stamp of each wallet's last invalidation. Stamps come from one global
+# counter, so a reader that loaded before an invalidation never matches the
+# new stamp, even if the wallet's old stamp was evicted in between.
+_wallet_generation: OrderedDict[str, int] = OrderedDict()
+_generation_counter = 0
 
 
 class Trade(Base):
@@ -115,8 +125,6 @@ def save_trades(trades: dict, wallet_address: str) -> None:
             return
 
         wallet = wallet_address.lower()
-        # Invalidate cache when trades are saved
-        invalidate_round_trip_cache(wallet)
 
         for trade_id, trade_data in trades.items():
             existing = session.query(Trade).filter(Trade.id == trade_id).first()
@@ -149,6 +157,10 @@ def save_trades(trades: dict, wallet_address: str) -> None:
                 session.add(trade)
         session.commit()
 
+    # Invalidate after commit; the new stamp also stops loads that started
+    # before the commit from caching the pre-sync rows
+    invalidate_wallet_cache(wallet_address)
+
 
 def merge_trades(existing: dict, new_trades: list) -> dict:
     """Merge new trades with existing trades, preserving notes."""
@@ -177,33 +189,98 @@ def update_trade_notes(trade_id: str, notes: str, wallet_address: str) -> bool:
 
             trade.notes = notes
             session.commit()
+            invalidate_wallet_cache(wallet_address)
             return True
         except Exception:
             return False
 
 
+def _cache_get(wallet_address: str, kind: str):
+    """Return a cached result for a wallet, or None if missing or expired."""
+    wallet = wallet_address.lower()
+    with _wallet_cache_lock:
+        results = _wallet_cache.get(wallet)
+        if results is None:
+            return None
+        entry = results.get(kind)
+        if entry is None:
+            return None
+        cached_time, cached_result = entry
+        if time.time() - cached_time >= WALLET_CACHE_TTL:
+            # Drop expired results so they don't pin memory until overwritten
+            del results[kind]
+            if not results:
+                del _wallet_cache[wallet]
+            return None
+        _wallet_cache.move_to_end(wallet)
+        return cached_result
+
+
+def _cache_generation(wallet_address: str) -> int:
+    """Current invalidation stamp for a wallet; take it before loading data to cache."""
+    with _wallet_cache_lock:
+        return _wallet_generation.get(wallet_address.lower(), 0)
+
+
+def _cache_set(wallet_address: str, kind: str, result, generation: int) -> None:
+    """
+    Store a derived result for a wallet, evicting the least recently used wallet if full.
+
+    Skipped if the wallet was invalidated since generation was read, so a load
+    that raced a save can't cache the pre-save rows.
+    """
+    wallet = wallet_address.lower()
+    with _wallet_cache_lock:
+        if _wallet_generation.get(wallet, 0) != generation:
+            return
+        results = _wallet_cache.get(wallet)
+        if results is None:
+            results = _wallet_cache[wallet] = {}
+        else:
+            _wallet_cache.move_to_end(wallet)
+        results[kind] = (time.time(), result)
+        while len(_wallet_cache) > WALLET_CACHE_MAXSIZE:
+            _wallet_cache.popitem(last=False)
+
+
+def _load_trades_cached(wallet_address: str) -> dict:
+    """
+    Load trades through the wallet cache.
+
+    The returned dict is shared between callers and must be treated as
+    read-only; use load_trades() when the result will be modified.
+    """
+    trades = _cache_get(wallet_address, "trades")
+    if trades is None:
+        generation = _cache_generation(wallet_address)
+        trades = load_trades(wallet_address)
+        _cache_set(wallet_address, "trades", trades, generation)
+    return trades
+
+
 def get_trades_sorted(wallet_address: str, descending: bool = True) -> list:
-    """Get all trades for a wallet sorted by timestamp."""
-    trades = load_trades(wallet_address)
+    """Get all trades for a wallet sorted by timestamp. Results are cached for performance."""
+    kind = "trades_desc" if descending else "trades_asc"
+    cached = _cache_get(wallet_address, kind)
+    if cached is not None:
+        return cached
+
+    generation = _cache_generation(wallet_address)
+    trades = _load_trades_cached(wallet_address)
     trade_list = list(trades.values())
     trade_list.sort(key=lambda x: x.get("timestamp", 0), reverse=descending)
+    _cache_set(wallet_address, kind, trade_list, generation)
     return trade_list
 
 
-def get_round_trips(wallet_address: str) -> list:
-    """Group individual fills into round-trip trades. Results are cached for performance."""
-    cache_key = wallet_address.lower()
-
-    # Check cache
-    if cache_key in _round_trip_cache:
-        cached_time, cached_result = _round_trip_cache[cache_key]
-        if time.time() - cached_time < ROUND_TRIP_CACHE_TTL:
-            return cached_result
-
-    trades = load_trades(wallet_address)
-    if not trades:
-        return []
+def _build_round_trips_and_assets(wallet_address: str) -> tuple[list, list]:
+    """
+    Build round trips and unique assets in a single pass over a wallet's fills.
 
+    Both results are cached, so either getter can be served from this pass.
+    """
+    generation = _cache_generation(wallet_address)
+    trades = _load_trades_cached(wallet_address)
     fills = sorted(trades.values(), key=lambda x: x.get("timestamp", 0))
     open_positions = {}
     round_trips = []
@@ -289,10 +366,25 @@ def get_round_trips(wallet_address: str) -> list:
 
     round_trips.sort(key=lambda x: x["exit_time"], reverse=True)
 
-    # Cache the result
-    _round_trip_cache[cache_key] = (time.time(), round_trips)
+    # Every traded asset was seen while pairing fills
+    assets = []
+    for asset in sorted(a for a in open_positions if a):
+        display_name = get_spot_name(asset) if asset.startswith(SPOT_ASSET_PREFIX) else asset
+        assets.append({"id": asset, "name": display_name})
 
-    return round_trips
+    # Cache the results
+    _cache_set(wallet_address, "round_trips", round_trips, generation)
+    _cache_set(wallet_address, "assets", assets, generation)
+
+    return round_trips, assets
+
+
+def get_round_trips(wallet_address: str) -> list:
+    """Group individual fills into round-trip trades. Results are cached for performance."""
+    cached = _cache_get(wallet_address, "round_trips")
+    if cached is not None:
+        return cached
+    return _build_round_trips_and_assets(wallet_address)[0]
 
 
 def update_round_trip_notes(round_trip_id: str, notes: str, wallet_address: str) -> bool:
@@ -300,30 +392,46 @@ def update_round_trip_notes(round_trip_id: str, notes: str, wallet_address: str)
     if not round_trip_id.startswith(ROUND_TRIP_PREFIX):
         return False
     exit_fill_id = round_trip_id[len(ROUND_TRIP_PREFIX):]
-    # Invalidate cache on update
-    invalidate_round_trip_cache(wallet_address)
+    # update_trade_notes invalidates the wallet cache on success
     return update_trade_notes(exit_fill_id, notes, wallet_address)
 
 
 def get_unique_assets(wallet_address: str) -> list:
-    """Get list of unique assets from all trades for a wallet."""
-    trades = load_trades(wallet_address)
-    assets = set(t.get("asset", "") for t in trades.values())
-    result = []
-    for asset in sorted([a for a in assets if a]):
-        display_name = get_spot_name(asset) if asset.startswith(SPOT_ASSET_PREFIX) else asset
-        result.append({"id": asset, "name": display_name})
-    return result
+    """Get list of unique assets from all trades for a wallet. Results are cached for performance."""
+    cached = _cache_get(wallet_address, "assets")
+    if cached is not None:
+        return cached
+    return _build_round_trips_and_assets(wallet_address)[1]
+
+
+def get_init_bundle(wallet_address: str) -> dict:
+    """Get round trips and unique assets together, computed from one pass over the trades."""
+    round_trips = _cache_get(wallet_address, "round_trips")
+    assets = _cache_get(wallet_address, "assets")
+    if round_trips is None or assets is None:
+        round_trips, assets = _build_round_trips_and_assets(wallet_address)
+    return {"roundtrips": round_trips, "assets": assets}
+
+
+def invalidate_wallet_cache(wallet_address: str) -> None:
+    """Invalidate all cached results (trades, round trips, assets) for a wallet."""
+    global _generation_counter
+    wallet = wallet_address.lower()
+    with _wallet_cache_lock:
+        _wallet_cache.pop(wallet, None)
+        _generation_counter += 1
+        _wallet_generation[wallet] = _generation_counter
+        _wallet_generation.move_to_end(wallet)
+        while len(_wallet_generation) > WALLET_CACHE_MAXSIZE:
+            _wallet_generation.popitem(last=False)
 
 
+# Legacy functions for backward compatibility
 def invalidate_round_trip_cache(wallet_address: str) -> None:
-    """Invalidate cached round trips for a wallet."""
-    cache_key = wallet_address.lower()
-    if cache_key in _round_trip_cache:
-        del _round_trip_cache[cache_key]
+    """Deprecated - use invalidate_wallet_cache."""
+    invalidate_wallet_cache(wallet_address)
 
 
-# Legacy functions for backward compatibility
 def get_stored_wallet() -> str:
     """Deprecated - wallet is now per-request."""
     return None
@@ -0,0 +1,72 @@
+"""Tests for the headline keyword prefilter in sentiment.analyzer."""
+
+import re
+from datetime import datetime, timezone
+
+import orjson
+import pytest
+
+from sentiment.aggregator import NewsItem, NewsSource
+from sentiment.analyzer import SentimentAnalyzer, SentimentScore, _has_signal_keywords
+
+_NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize("title", [
+    "Bitcoin rises above $70,000",
+    "Ethereum falls below $3,000",
+    "Bitcoin breaks $100K",
+    "XRP slides 8%",
+    "Bullish momentum builds for ETH",
+    "BlackRock files for Solana fund",
+    "Tether mints $1B USDT",
+    "SEC sues Binance over unregistered securities",
+    "Federal Reserve signals rate cut",
+    "Exchange hacked for $40M",
+])
+def test_market_moving_headlines_pass(title):
+    assert _has_signal_keywords(title)
+
+
+@pytest.mark.parametrize("title", [
+    "New banner design for the community site",
+    "Local bank opens new branch",
+    "Sue from marketing shares her favorite podcasts",
+    "Federal holiday schedule announced",
+    "Interview with a Web3 artist",
+])
+def test_unrelated_headlines_are_skipped(title):
+    assert not _has_signal_keywords(title)
+
+
+def test_prefilter_is_off_by_default():
+    assert SentimentAnalyzer("test-key").prefilter is False
+
+
+def test_enabled_prefilter_skips_api_for_keywordless_headlines(monkeypatch):
+    analyzer = SentimentAnalyzer("test-key", prefilter=True)
+    prompts = []
+
+    def fake_call_claude(prompt, max_tokens=0):
+        prompts.append(prompt)
+        count = len(re.findall(r"^\d+\. ", prompt, re.MULTILINE))
+        return orjson.dumps([{
+            "sentiment": "bullish", "confidence": 0.9, "signal_strength": "strong",
+            "price_impact": "up", "timeframe": "short_term", "reasoning": "test"
+        }] * count).decode()
+
+    monkeypatch.setattr(analyzer, "_call_claude", fake_call_claude)
+    items = [
+        NewsItem(id="a", title="Bitcoin breaks $100K", url="https://x/a",
+                 source=NewsSource.CRYPTONEWS, source_name="x", published_at=_NOW),
+        NewsItem(id="b", title="Interview with a Web3 artist", url="https://x/b",
+                 source=NewsSource.CRYPTONEWS, source_name="x", published_at=_NOW),
+    ]
+
+    results = analyzer.analyze_batch(items)
+
+    assert len(prompts) == 1
+    assert "Bitcoin breaks $100K" in prompts[0]
+    assert "Web3 artist" not in prompts[0]
+    assert [r.news_id for r in results] == ["a", "b"]
+    assert results[1].sentiment == SentimentScore.NEUTRAL
@@ -0,0 +1,51 @@
+"""Tests for the cached, ETag-aware signal endpoints in app."""
+
+import pytest
+
+import app as app_module
+
+
+class _FakeSession:
+    def close(self):
+        pass
+
+
+class _FakeRepository:
+    calls = 0
+
+    def __init__(self, session):
+        pass
+
+    def get_signal_stats(self, hours=24):
+        _FakeRepository.calls += 1
+        return {"total": 3, "actionable": 1, "by_sentiment": {"bullish": 3}, "hours": hours}
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(app_module, "init_sentiment_db", lambda url: True)
+    monkeypatch.setattr(app_module, "get_sentiment_session", _FakeSession)
+    monkeypatch.setattr(app_module, "SignalRepository", _FakeRepository)
+    _FakeRepository.calls = 0
+    with app_module._signals_cache_lock:
+        app_module._signals_cache.clear()
+    return app_module.app.test_client()
+
+
+def test_signal_stats_matching_etag_returns_304(client):
+    first = client.get("/api/signals/stats?hours=24")
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    assert etag.startswith('W/"')
+
+    second = client.get("/api/signals/stats?hours=24", headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.data == b""
+    # The second request was answered from the cache
+    assert _FakeRepository.calls == 1
+
+
+def test_signal_stats_stale_etag_returns_body(client):
+    response = client.get("/api/signals/stats?hours=24", headers={"If-None-Match": 'W/"stale"'})
+    assert response.status_code == 200
+    assert response.get_json()["total"] == 3